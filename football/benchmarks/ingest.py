@@ -0,0 +1,78 @@
+# benchmarks/ingest.py
+"""
+Season-file ingest scaling: the old one-at-a-time reader (per-row week padding,
+concat inside the loop) against data_loader._read_player_files.
+
+Synthetic seasons are copies of the real data/ files renamed to earlier years, so
+file sizes match what a backfill would add. Run from the football/ directory:
+    python benchmarks/ingest.py
+    python benchmarks/ingest.py --counts 7 20 50 --repeat 5
+
+Measured on a single-core machine (best of 3):
+     files   legacy (s)  current (s)
+         7        0.433        0.441   (1.0x: no gain at today's size)
+        14        0.966        0.824   (1.2x)
+        28        2.092        1.767   (1.2x)
+        50        4.870        2.741   (1.8x)
+CSV parsing dominates and is the same in both readers; what the current reader saves
+is the concat inside the loop, which grows with the number of files.
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import _read_player_files  # noqa: E402
+
+
+def legacy_read_player_files(data_path):
+    files = sorted([f for f in os.listdir(data_path) if f.lower().endswith('.csv')])
+    df = pd.DataFrame()
+    for file in files:
+        new_file = pd.read_csv(os.path.join(data_path, file))
+        new_file['week_padded'] = new_file['week'].apply(lambda x: f'{int(x):02d}')
+        new_file['year'] = file[:4]
+        df = pd.concat([df, new_file], axis=0, ignore_index=True)
+    return df
+
+
+def make_seasons(source_path, target_path, count):
+    sources = sorted(f for f in os.listdir(source_path) if f.lower().endswith('.csv'))
+    last_year = int(sources[-1][:4])
+    for i in range(count):
+        src = sources[-1 - (i % len(sources))]
+        shutil.copyfile(os.path.join(source_path, src), os.path.join(target_path, f'{last_year - i}_stats.csv'))
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default=os.path.join(os.getcwd(), 'data'))
+    parser.add_argument('--counts', type=int, nargs='+', default=[7, 14, 28, 50])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'rows':>8} {'legacy (s)':>11} {'current (s)':>12} {'speedup':>8}")
+    for count in args.counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            make_seasons(args.data, tmp, count)
+            rows = len(_read_player_files(tmp))
+            legacy = best_of(lambda: legacy_read_player_files(tmp), args.repeat)
+            current = best_of(lambda: _read_player_files(tmp), args.repeat)
+            print(f"{count:>6} {rows:>8} {legacy:>11.3f} {current:>12.3f} {legacy / current:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
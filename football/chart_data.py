@@ -0,0 +1,48 @@
+# chart_data.py
+"""
+Chart-data layer: the frames handed to Altair, cut down to what each chart encodes.
+
+Altair ships a chart's data with its Vega-Lite spec, and every st.altair_chart call is
+a separate spec, so a page with a dozen charts sends its data a dozen times.
+stat_dataset builds one frame per stat for a page: the rows it shows summed to one
+row per (x, color) pair (what the stacked bars would add up anyway), with only the
+columns some chart of that stat uses. chart_frame then cuts that shared frame down to
+the fields a single chart encodes before it is handed to alt.Chart.
+
+value_summary computes the reference values drawn over a stat's bars (min, average,
+max) in one NumPy pass, so the rules can be layered on the
+bars' own data instead of each bringing a one-row frame of its own.
+"""
+import numpy as np
+import pandas as pd
+
+
+def stat_dataset(df, keys, sums, firsts=()):
+    """
+    df summed per keys (e.g. year_week, Player): sums are added up, firsts (values
+    constant within a key, like a season total) are carried over. Keys come back as
+    plain strings.
+    """
+    sums = [c for c in sums if c in df.columns]
+    firsts = [c for c in firsts if c in df.columns]
+    keys = list(keys)
+    if df.empty:
+        return pd.DataFrame(columns=keys + sums + firsts)
+    dataset = df.groupby(keys, observed=True, sort=False).agg(
+        {**{c: 'sum' for c in sums}, **{c: 'first' for c in firsts}}).reset_index()
+    for key in keys:
+        dataset[key] = dataset[key].astype(str)
+    return dataset
+
+
+def chart_frame(dataset, *fields):
+    """The columns of dataset one chart encodes (each once, in the order given)."""
+    return dataset[list(dict.fromkeys(fields))]
+
+
+def value_summary(values):
+    """(min, average rounded to 0.1, max) of one stat; NaN values are skipped."""
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.nan, np.nan, np.nan
+    return np.nanmin(values), round(np.nanmean(values), 1), np.nanmax(values)
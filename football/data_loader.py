@@ -1,75 +1,63 @@
 # data_loader.py
 import os
+import logging
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from utils import real_teams, reversed_real_teams
-
-def _read_player_files(data_path):
-    files = sorted([f for f in os.listdir(data_path) if f.lower().endswith('.csv')])
-    df = pd.DataFrame()
-    for file in files:
-        fp = os.path.join(data_path, file)
-        new_file = pd.read_csv(fp)
-        if 'week' in new_file.columns:
-            new_file['week_padded'] = new_file['week'].apply(lambda x: f'{int(x):02d}')
-        else:
-            new_file['week_padded'] = new_file.get('week_padded', '')
-        new_file['year'] = file[:4]
-        df = pd.concat([df, new_file], axis=0, ignore_index=True)
-    return df
-
-def load_data():
-    path = os.getcwd()
-    data_path = os.path.join(path, 'data')
-    upcoming_path = os.path.join(path, 'games')
-    metadata_path = os.path.join(path, 'metadata')
-    logo_path = os.path.join(path, 'logo')
+from concurrent.futures import ThreadPoolExecutor
+from utils import real_teams, reversed_real_teams, freeze
+from season_store import read_season, season_files, source_stamp
+from schema import compact, memory_mb, INT_STAT_COLUMNS, DERIVED_STAT_COLUMNS
+import sql_backend
+from leaderboards import season_boards
+from projections import season_projections
+from matchups import MatchupCube, MatchupCache
+from hit_rates import HitRates
 
-    # year logic (same as original)
-    current_date = datetime.now()
-    year = current_date.year
-    month = current_date.month
-    if 3 <= month <= 5:
-        new_year = year + 1
-    else:
-        new_year = year - 1
+logger = logging.getLogger(__name__)
 
-    # read player files
-    df = _read_player_files(data_path)
+# Derived player-week frame for each season (in the compact schema), reused by later
+# snapshots until that season's file changes:
+# {season file name: (source stamp, compact season frame, partial totals)}
+_SEASON_CACHE = {}
+TOTAL_COLUMNS = ['Passing_Yds', 'Rushing_Yds', 'Receiving_Yds']
+READ_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+# counting stats averaged into the shared aggregate tables
+AGG_COLUMNS = INT_STAT_COLUMNS + DERIVED_STAT_COLUMNS
 
-    # upcoming/completed games (safe load)
-    upcoming_games = pd.DataFrame()
-    completed_games = pd.DataFrame()
-    upcoming_games_fp = os.path.join(upcoming_path, f'upcoming_games_{new_year}.csv')
-    completed_games_fp = os.path.join(upcoming_path, f'completed_games_{new_year}.csv')
-    if os.path.exists(upcoming_games_fp):
-        upcoming_games = pd.read_csv(upcoming_games_fp)
-    if os.path.exists(completed_games_fp):
-        completed_games = pd.read_csv(completed_games_fp)
-
-    # normalize Football Team -> Commanders (same as original)
-    for gdf in [upcoming_games, completed_games]:
-        if not gdf.empty:
-            if 'opp_name' in gdf.columns:
-                gdf['opp_name'] = gdf['opp_name'].str.replace('Football Team', 'Commanders')
-            if 'tm_name' in gdf.columns:
-                gdf['tm_name'] = gdf['tm_name'].str.replace('Football Team', 'Commanders')
+def _read_player_file(data_path, file):
+    # columnar store when it is up to date, CSV otherwise (see season_store.py)
+    new_file = read_season(data_path, file)
+    if 'week' in new_file.columns:
+        # pad each distinct week once and map, instead of formatting every row
+        weeks = new_file['week'].astype(int)
+        new_file['week_padded'] = weeks.map({w: f'{w:02d}' for w in weeks.unique()})
+    else:
+        new_file['week_padded'] = new_file.get('week_padded', '')
+    new_file['year'] = file[:4]
+    return new_file
 
-    # metadata
-    color_df = pd.DataFrame()
-    location_df = pd.DataFrame()
-    team_colors_fp = os.path.join(metadata_path, 'team_colors.csv')
-    team_location_fp = os.path.join(metadata_path, 'team_location.csv')
-    if os.path.exists(team_colors_fp):
-        color_df = pd.read_csv(team_colors_fp)
-    if os.path.exists(team_location_fp):
-        location_df = pd.read_csv(team_location_fp)
-        if 'logo' in location_df.columns:
-            location_df['logo_path'] = location_df['logo'].apply(lambda n: os.path.join(logo_path, n))
-        location_df['city_team'] = location_df.get('City', '') + ' ' + location_df.get('Team', '')
+def _read_player_files(data_path, files=None, max_workers=None):
+    """
+    Read season files on a thread pool and concatenate them once, in file order.
+    Parsing dominates, so with a handful of files this is no faster than a plain
+    loop; the single concat is what keeps many seasons linear (benchmarks/ingest.py).
+    """
+    if files is None:
+        files = season_files(data_path)
+    if not files:
+        return pd.DataFrame()
+    workers = max_workers or min(READ_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(lambda f: _read_player_file(data_path, f), files))
+    return pd.concat(frames, axis=0, ignore_index=True)
 
-    # build derived fields exactly like original
+def _derive_seasons(df):
+    """
+    Per-season derived fields: year_week, combined yardage columns, Real_Team and the
+    Season_* aggregates. Only looks within a season, so it can run on any set of seasons.
+    """
     if 'week_padded' in df.columns and 'year' in df.columns:
         df['year_week'] = df['year'].astype(str) + '_' + df['week_padded'].astype(str)
     # safety: treat missing numeric columns as zero for arithmetic
@@ -89,6 +77,98 @@ def load_data():
     else:
         df['Real_Team'] = df.get('Real_Team', np.nan)
 
+    # season aggregates used across pages
+    try:
+        # Team is the first team the player appeared for that season
+        df_aggregates = df.groupby(['Player','year']).agg({'Team':'first', 'Passing_Yds':'sum',
+                                                           'Rushing_Yds':'sum', 'Receiving_Yds':'sum'}).reset_index()
+        df_aggregates = df_aggregates[['Player','Team','year','Passing_Yds','Rushing_Yds','Receiving_Yds']]
+        df_aggregates = df_aggregates.rename({'Passing_Yds':'Season_Passing_Yds',
+                                              'Rushing_Yds':'Season_Rushing_Yds',
+                                              'Receiving_Yds':'Season_Receiving_Yds'}, axis=1)
+        df = pd.merge(df, df_aggregates, how='left', on=['Team','year','Player'])
+    except Exception:
+        pass
+
+    return df
+
+def _load_seasons(data_path):
+    """
+    Concatenated per-season frames plus career yardage per (Player, Team).
+    Seasons whose source file is unchanged come from _SEASON_CACHE.
+    """
+    files = season_files(data_path)
+    stamps = {f: source_stamp(data_path, f) for f in files}
+    stale = [f for f in files if f not in _SEASON_CACHE or _SEASON_CACHE[f][0] != stamps[f]]
+    if stale:
+        derived = _derive_seasons(_read_player_files(data_path, stale))
+        by_year = dict(tuple(derived.groupby('year', sort=False)))
+        for file in stale:
+            season = by_year.get(file[:4], derived.iloc[0:0])
+            partial = season.groupby(['Player','Team'])[TOTAL_COLUMNS].sum()
+            # kept for the life of the process, so only in the compact schema
+            _SEASON_CACHE[file] = (stamps[file], compact(season), partial)
+    for file in list(_SEASON_CACHE):
+        if file not in stamps:
+            del _SEASON_CACHE[file]
+
+    parts = [_SEASON_CACHE[f] for f in files]
+    if not parts:
+        raise FileNotFoundError(f"No season stat files found in {data_path}")
+    with warnings.catch_warnings():
+        # a label column that is blank for a whole season (game_time) concatenates to
+        # object either way; compact() in load_data turns it back into a categorical
+        warnings.simplefilter('ignore', FutureWarning)
+        df = pd.concat([p[1] for p in parts], axis=0, ignore_index=True)
+    player_totals = pd.concat([p[2] for p in parts]).groupby(level=['Player','Team']).sum()
+    return df, player_totals
+
+def _build_aggregates(df):
+    """
+    Aggregate tables shared by the screens, built once per snapshot from the counting
+    stats only (no string columns):
+      player_season_avg  (Player, Team, year): per-game means incl. Passing_Rate
+    Season totals live on the per-season leaderboards (leaderboards.SeasonBoard).
+    """
+    stats = [c for c in AGG_COLUMNS if c in df.columns]
+    means = [c for c in stats + ['Passing_Rate'] if c in df.columns]
+    player_season_avg = df.groupby(['Player','Team','year'], observed=True)[means].mean().reset_index()
+    player_season_avg['Team'] = player_season_avg['Team'].astype(str)
+
+    return {
+        "player_season_avg": player_season_avg,
+    }
+
+def _build_indexes(df):
+    """
+    Hash indexes from lookup keys to row positions in df, so screens can slice with
+    utils.take_rows instead of scanning the whole frame with boolean masks.
+    """
+    return {
+        "team_year": df.groupby(['Real_Team','year'], observed=True).indices,
+        "player_year": df.groupby(['Player','year'], observed=True).indices,
+    }
+
+def _read_games(upcoming_path, season):
+    """Upcoming and completed games of one season with team names and year_week formatted."""
+    # upcoming/completed games (safe load)
+    upcoming_games = pd.DataFrame()
+    completed_games = pd.DataFrame()
+    upcoming_games_fp = os.path.join(upcoming_path, f'upcoming_games_{season}.csv')
+    completed_games_fp = os.path.join(upcoming_path, f'completed_games_{season}.csv')
+    if os.path.exists(upcoming_games_fp):
+        upcoming_games = pd.read_csv(upcoming_games_fp)
+    if os.path.exists(completed_games_fp):
+        completed_games = pd.read_csv(completed_games_fp)
+
+    # normalize Football Team -> Commanders (same as original)
+    for gdf in [upcoming_games, completed_games]:
+        if not gdf.empty:
+            if 'opp_name' in gdf.columns:
+                gdf['opp_name'] = gdf['opp_name'].str.replace('Football Team', 'Commanders')
+            if 'tm_name' in gdf.columns:
+                gdf['tm_name'] = gdf['tm_name'].str.replace('Football Team', 'Commanders')
+
     # games formatting
     if not completed_games.empty:
         completed_games['year_week'] = completed_games['season'].astype(str) + '_' + completed_games['week'].apply(lambda x: f'{int(x):02d}')
@@ -100,21 +180,101 @@ def load_data():
         upcoming_games['Home_Team'] = upcoming_games['opp_market'] + ' ' + upcoming_games['opp_name']
         upcoming_games['Game'] = upcoming_games['Away_Team'] + ' @ ' + upcoming_games['Home_Team']
 
-    # season aggrsegates used across pages
-    try:
-        df_aggregates = df.groupby(['Player','year']).sum().reset_index()
-        df_aggregates = df_aggregates[['Player','Team','year','Passing_Yds','Rushing_Yds','Receiving_Yds']]
-        df_aggregates = df_aggregates.rename({'Passing_Yds':'Season_Passing_Yds',
-                                              'Rushing_Yds':'Season_Rushing_Yds',
-                                              'Receiving_Yds':'Season_Receiving_Yds'}, axis=1)
-        df_aggregates['Team'] = df_aggregates['Team'].str[:3]
-        df = pd.merge(df, df_aggregates, how='left', on=['Team','year','Player'])
-    except Exception:
-        pass
+    return upcoming_games, completed_games
+
+def _build_team_games(completed_games):
+    """
+    Completed games from each team's side, two rows per game, indexed by team:
+    year_week, team, opponent, points_for, points_against, location (H/A/N), result
+    (Win/Loss/Tie). Screens look a team's games up with team_games.loc[[team]].
+    """
+    columns = ['year_week', 'team', 'opponent', 'points_for', 'points_against', 'location', 'result']
+    if completed_games.empty:
+        return pd.DataFrame(columns=columns).set_index('team', drop=False)
+    sides = []
+    for team, opponent, points_for, points_against, location in [
+            ('team1', 'team2', 'tm_score', 'opp_score', 'tm_location'),
+            ('team2', 'team1', 'opp_score', 'tm_score', 'opp_location')]:
+        side = pd.DataFrame({
+            'year_week': completed_games['year_week'],
+            'team': completed_games[team],
+            'opponent': completed_games[opponent],
+            'points_for': completed_games[points_for],
+            'points_against': completed_games[points_against],
+            'location': completed_games[location] if location in completed_games.columns else '',
+        })
+        sides.append(side)
+    team_games = pd.concat(sides, ignore_index=True)
+    margin = (team_games['points_for'] - team_games['points_against']).to_numpy()
+    team_games['result'] = np.select([margin > 0, margin < 0], ['Win', 'Loss'], 'Tie')
+    return team_games.sort_values(['team', 'year_week'], kind='stable').set_index('team', drop=False)
+
+def _current_season():
+    # year logic (same as original)
+    current_date = datetime.now()
+    year = current_date.year
+    month = current_date.month
+    if 3 <= month <= 5:
+        return year + 1
+    return year - 1
 
+def data_fingerprint(path=None):
+    """
+    Identity of everything load_data reads: (relative path, mtime, size) for each file
+    under data/, games/ and metadata/, plus the season the loader resolves to.
+    Used as the cache key for the shared snapshot in main.py.
+    """
+    path = path or os.getcwd()
+    files = []
+    for folder in ['data', 'games', 'metadata']:
+        for root, _, names in os.walk(os.path.join(path, folder)):
+            for name in names:
+                fp = os.path.join(root, name)
+                try:
+                    st = os.stat(fp)
+                except OSError:
+                    continue
+                files.append((os.path.relpath(fp, path), st.st_mtime_ns, st.st_size))
+    if sql_backend.enabled():
+        # rebuilding the database should switch the snapshot over to it
+        try:
+            st = os.stat(sql_backend.db_path(path))
+            files.append((sql_backend.DB_FILENAME, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+    return (_current_season(), tuple(sorted(files)))
+
+def load_data():
+    path = os.getcwd()
+    data_path = os.path.join(path, 'data')
+    upcoming_path = os.path.join(path, 'games')
+    metadata_path = os.path.join(path, 'metadata')
+    logo_path = os.path.join(path, 'logo')
+
+    new_year = _current_season()
+
+    # read player files (only seasons whose file changed are re-read and re-derived)
+    df, player_totals = _load_seasons(data_path)
+
+    # upcoming/completed games for the current season
+    upcoming_games, completed_games = _read_games(upcoming_path, new_year)
+
+    # metadata
+    color_df = pd.DataFrame()
+    location_df = pd.DataFrame()
+    team_colors_fp = os.path.join(metadata_path, 'team_colors.csv')
+    team_location_fp = os.path.join(metadata_path, 'team_location.csv')
+    if os.path.exists(team_colors_fp):
+        color_df = pd.read_csv(team_colors_fp)
+    if os.path.exists(team_location_fp):
+        location_df = pd.read_csv(team_location_fp)
+        if 'logo' in location_df.columns:
+            location_df['logo_path'] = location_df['logo'].apply(lambda n: os.path.join(logo_path, n))
+        location_df['city_team'] = location_df.get('City', '') + ' ' + location_df.get('Team', '')
+
+    # career totals per (Player, Team), combined from the per-season partial sums
     try:
-        df_total = df.groupby(['Player','Team']).sum().reset_index()
-        df_total = df_total[['Player','Team','Passing_Yds','Rushing_Yds','Receiving_Yds']]
+        df_total = player_totals.reset_index()
         df_total = df_total.rename({'Passing_Yds':'Total_Passing_Yds',
                                     'Rushing_Yds':'Total_Rushing_Yds',
                                     'Receiving_Yds':'Total_Receiving_Yds'}, axis=1)
@@ -128,17 +288,65 @@ def load_data():
     df.loc[(df['Total_Passing_Yds'] > df['Total_Rushing_Yds']) & (df['Total_Passing_Yds'] > df['Total_Receiving_Yds']), 'Player_Category'] = 'Quarterback'
     df.loc[(df['Total_Rushing_Yds'] > df['Total_Passing_Yds']) & (df['Total_Rushing_Yds'] > df['Total_Receiving_Yds']), 'Player_Category'] = 'Running Back'
 
+    # compact dtypes: drop index artifacts, categorical labels, small-int stats (the cached
+    # seasons are already compact; labels whose categories differ per season concat to object)
+    memory = {'before_mb': memory_mb(df)}
+    df = compact(df)
+    memory['after_mb'] = memory_mb(df)
+    logger.info("player-week frame: %s MB -> %s MB with the compact schema", memory['before_mb'], memory['after_mb'])
+
     # build team list
     teams = sorted(list(df['Real_Team'].dropna().unique()))
 
-    return {
-        "df": df,
-        "upcoming_games": upcoming_games,
-        "completed_games": completed_games,
-        "color_df": color_df,
-        "location_df": location_df,
+    # embedded SQL backend (opt-in, only when the database file is up to date)
+    sql_path = None
+    if sql_backend.enabled():
+        sql_path = sql_backend.db_path(path)
+        if not sql_backend.is_fresh(sql_path, path):
+            logger.warning("%s is missing or older than the data files; run sql_backend.py to rebuild it", sql_path)
+            sql_path = None
+
+    # the snapshot is shared by every session: the array values of its frames and
+    # indexes are read-only (see utils.freeze)
+    indexes = _build_indexes(df)
+    for index in indexes.values():
+        for positions in index.values():
+            positions.flags.writeable = False
+    aggregates = {name: freeze(table) for name, table in _build_aggregates(df).items()}
+    leaderboards = season_boards(df)
+    team_games = freeze(_build_team_games(completed_games))
+    current_board = leaderboards.get(str(new_year))
+
+    data = {
+        "df": freeze(df),
+        **aggregates,
+        "indexes": indexes,
+        # per-season ranked player totals (leaderboards.SeasonBoard)
+        "leaderboards": leaderboards,
+        # full-season projections for the current season's players (aligned with its board)
+        "projections": season_projections(current_board, completed_games) if current_board is not None else None,
+        "upcoming_games": freeze(upcoming_games),
+        "completed_games": freeze(completed_games),
+        "team_games": team_games,
+        # offense/defense yards per team and week for the matchup page
+        "matchups": MatchupCube(df, team_games),
+        "color_df": freeze(color_df),
+        "location_df": freeze(location_df),
         "teams": teams,
         "current_year": new_year,
         "path": path,
-        "logo_path": logo_path
+        "logo_path": logo_path,
+        "memory": memory,
+        "sql_path": sql_path,
+        # per-snapshot results shared across sessions (see utils.memoize)
+        "memo": {}
     }
+
+    # per-player hit rates (games at or over a target) for the player and bets pages
+    data["hit_rates"] = HitRates(data["df"])
+
+    # derive this week's matchups in the background; the matchup page reads them from here
+    data["matchup_cache"] = MatchupCache(data)
+    if not upcoming_games.empty:
+        data["matchup_cache"].prefetch(zip(upcoming_games['Away_Team'], upcoming_games['Home_Team']))
+    return data
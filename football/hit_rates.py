@@ -0,0 +1,119 @@
+# hit_rates.py
+"""
+Hit-rate engine: in how many of their games did a player reach >= T of a stat.
+
+HitRates.table(stat, years) lays out one value per player-game (the week's largest
+row, so a game counts once) in a single array, sorted ascending within each player's
+segment, with per-player offsets (CSR). A player's games at or over T are the tail of
+their segment, found by binary search.
+
+Each table also holds the full alt-line ladder: ladder[i, k] is how many of player
+i's games reached the integer line k, for every k from 0 to the stat's max (the
+empirical survival function, all players at once from one bincount and a reversed
+cumsum). Integer targets, which is what the pages' inputs give, are a lookup in it;
+any other target falls back to the binary search. Tables are built on first use and
+kept in a small LRU on the snapshot, so moving a threshold does no work at all.
+"""
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+TABLE_CACHE_SIZE = 32
+
+
+class HitTable:
+    def __init__(self, players, offsets, values):
+        self.players = players      # player names, in segment order
+        self.offsets = offsets      # segment i is values[offsets[i]:offsets[i + 1]]
+        self.values = values        # float64, sorted within each segment; missing values are -inf
+        self.games = np.diff(offsets)
+        self._position = {player: i for i, player in enumerate(players)}
+        # segment * span + (value - low) increases over the whole array, so a target can
+        # be placed in every segment with one searchsorted
+        finite = values[np.isfinite(values)]
+        self._low = finite.min() if finite.size else 0.0
+        self._span = finite.max() - self._low + 2 if finite.size else 2.0
+        segments = np.repeat(np.arange(len(players)), self.games)
+        self._keys = segments * self._span + np.maximum(values - self._low, -1)
+        self.ladder = _ladder(segments, values, len(players), self.games)
+
+    def _on_ladder(self, target):
+        return float(target).is_integer() and target >= 0
+
+    def hits(self, player, target):
+        """Games of player with a value >= target (0 for an unknown player)."""
+        i = self._position.get(player)
+        if i is None:
+            return 0
+        if self._on_ladder(target):
+            return int(self.ladder[i, int(target)]) if target < self.ladder.shape[1] else 0
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return int(end - start - np.searchsorted(self.values[start:end], target, 'left'))
+
+    def hits_all(self, target):
+        """Games >= target for every player, aligned with self.players."""
+        if self._on_ladder(target):
+            if target < self.ladder.shape[1]:
+                return self.ladder[:, int(target)].astype(int)
+            return np.zeros(len(self.players), dtype=int)
+        offset = np.clip(target - self._low, -0.5, self._span - 1.5)
+        keys = np.arange(len(self.players)) * self._span + offset
+        return self.offsets[1:] - np.searchsorted(self._keys, keys, 'left')
+
+    def frame(self, target):
+        """Player, Count_games (games >= target) and Total_games for every player."""
+        return pd.DataFrame({'Player': self.players, 'Count_games': self.hits_all(target), 'Total_games': self.games})
+
+
+def _ladder(segments, values, n_players, games):
+    """
+    (players x lines) counts of games with a value >= each integer line 0..max, in the
+    smallest integer type that holds a player's game count.
+    """
+    reached = values >= 0
+    lines = np.floor(values[reached]).astype(np.int64)
+    width = int(lines.max()) + 1 if lines.size else 1
+    counts = np.bincount(segments[reached] * width + lines, minlength=n_players * width)
+    ladder = counts.reshape(n_players, width)[:, ::-1].cumsum(axis=1)[:, ::-1]
+    ladder = ladder.astype(np.min_scalar_type(int(games.max()) if games.size else 0))
+    ladder.flags.writeable = False
+    return ladder
+
+
+class HitRates:
+    def __init__(self, df):
+        self._df = df
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _build(self, stat, years):
+        rows = self._df[['Player', 'year', 'year_week', stat]]
+        if years is not None:
+            rows = rows[rows['year'].isin(list(years))]
+        per_game = rows.groupby(['Player', 'year_week'], observed=True)[stat].max()
+        # segments follow the Player categories (alphabetical), like a groupby on Player
+        players = pd.Categorical(per_game.index.get_level_values('Player'))
+        codes = players.codes
+        values = per_game.to_numpy(dtype=float)
+        values = np.where(np.isnan(values), -np.inf, values)
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        present, starts = np.unique(codes, return_index=True)
+        offsets = np.append(starts, len(codes))
+        return HitTable(np.asarray(players.categories[present]).astype(str), offsets, values)
+
+    def table(self, stat, years=None):
+        """HitTable of stat over the seasons in years (all seasons when None)."""
+        key = (stat, None if years is None else tuple(sorted(str(y) for y in years)))
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                return table
+        table = self._build(stat, key[1])
+        with self._lock:
+            self._tables[key] = table
+            while len(self._tables) > TABLE_CACHE_SIZE:
+                self._tables.popitem(last=False)
+        return table
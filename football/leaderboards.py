@@ -0,0 +1,117 @@
+# leaderboards.py
+"""
+Season leaderboards shared by the home, fantasy and bets pages.
+
+One SeasonBoard per season holds per-player season totals (counting stats, Games,
+first Team of the season, fantasy points). Each ranked stat's descending order is
+computed once, so ranked and top-k queries are slices of a stored order instead of
+a sort per render.
+
+Boards are kept in a module cache across snapshots. When a season changes only by
+new weeks being appended (the usual in-season update), those weeks' per-player sums
+are added to the existing board. Any other change rebuilds that season's board.
+"""
+import numpy as np
+import pandas as pd
+from schema import INT_STAT_COLUMNS, DERIVED_STAT_COLUMNS
+from utils import freeze
+
+SUM_COLUMNS = INT_STAT_COLUMNS + DERIVED_STAT_COLUMNS
+RANKED_STATS = SUM_COLUMNS + ['half_ppr', 'ppr']
+
+# season -> SeasonBoard, reused by later snapshots (see season_boards)
+_BOARDS = {}
+
+
+def fantasy_points(df, reception_points):
+    """Fantasy points for rows of counting stats; 0.5 per reception is half PPR, 1 is PPR."""
+    return (
+        df["Passing_Yds"] / 25 +
+        df["Passing_TD"] * 4 -
+        df["Passing_Int"] * 2 +
+        df["Rushing_Yds"] * 0.1 +
+        df["Rushing_TD"] * 6 +
+        df["Receiving_Rec"] * reception_points +
+        df["Receiving_Yds"] * 0.1 +
+        df["Receiving_TD"] * 6 -
+        df["Fumbles_FL"] * 2
+    )
+
+
+def _player_totals(rows):
+    """Per-player sums, first Team and Games (distinct weeks) for the given rows of one season."""
+    sums = [c for c in SUM_COLUMNS if c in rows.columns]
+    table = rows.groupby('Player', observed=True).agg(
+        **{c: (c, 'sum') for c in sums}, Team=('Team', 'first'),
+        Games=('year_week', 'nunique'))
+    table = table.reset_index()
+    table['Player'] = table['Player'].astype(str)
+    table['Team'] = table['Team'].astype(str)
+    return table
+
+
+def _week_signature(rows):
+    """Row count and stat sums per week: tells appended weeks from edited ones."""
+    weeks, week_pos = np.unique(rows['week'].to_numpy(), return_inverse=True)
+    signature = {'rows': np.bincount(week_pos)}
+    for c in SUM_COLUMNS:
+        if c in rows.columns:
+            signature[c] = np.bincount(week_pos, weights=rows[c].to_numpy())
+    return pd.DataFrame(signature, index=pd.Index(weeks, name='week'))
+
+
+class SeasonBoard:
+    def __init__(self, season, table, signature):
+        table = table.reset_index(drop=True)
+        table['half_ppr'] = fantasy_points(table, 0.5)
+        table['ppr'] = fantasy_points(table, 1)
+        self.season = season
+        self.table = freeze(table)
+        self.signature = signature
+        # descending by value, ties broken by player name so ranks are stable
+        players = self.table['Player'].to_numpy()
+        self.order = {}
+        for stat in RANKED_STATS:
+            if stat in self.table.columns:
+                order = np.lexsort((players, -self.table[stat].to_numpy()))
+                order.flags.writeable = False
+                self.order[stat] = order
+
+    @classmethod
+    def build(cls, season, rows):
+        return cls(season, _player_totals(rows), _week_signature(rows))
+
+    def updated(self, rows):
+        """Board for the season's current rows, reusing this one when only weeks were added."""
+        signature = _week_signature(rows)
+        old_weeks = self.signature.index
+        if not old_weeks.isin(signature.index).all() or not signature.loc[old_weeks].equals(self.signature):
+            return SeasonBoard.build(self.season, rows)
+        new_weeks = signature.index.difference(old_weeks)
+        if new_weeks.empty:
+            return self
+        added = _player_totals(rows[rows['week'].isin(new_weeks)])
+        sums = [c for c in SUM_COLUMNS if c in added.columns]
+        combined = pd.concat([self.table[added.columns], added], ignore_index=True)
+        table = combined.groupby('Player').agg({**{c: 'sum' for c in sums}, 'Team': 'first', 'Games': 'sum'}).reset_index()
+        return SeasonBoard(self.season, table[added.columns], signature)
+
+    def ranked(self, stat):
+        """All players, best first."""
+        return self.table.take(self.order[stat])
+
+    def top(self, stat, k):
+        return self.table.take(self.order[stat][:k])
+
+
+def season_boards(df):
+    """{year: SeasonBoard} for every season in df, updating the cached boards."""
+    df = df[['Player', 'Team', 'year', 'week', 'year_week'] + [c for c in SUM_COLUMNS if c in df.columns]]
+    boards = {}
+    for season, positions in df.groupby('year', observed=True).indices.items():
+        rows = df.take(positions)
+        board = _BOARDS.get(season)
+        boards[season] = SeasonBoard.build(season, rows) if board is None else board.updated(rows)
+    _BOARDS.clear()
+    _BOARDS.update(boards)
+    return boards
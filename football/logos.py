@@ -0,0 +1,114 @@
+# logos.py
+"""
+Team logo service. Logos are read from logo/ once per process and kept in small
+resized variants:
+  svg_markup    SVG with a viewBox and the root width/height set to the display size
+                (the files mix 700/500/cm sizes and some have none), prolog,
+                editor metadata and comments stripped
+  png_thumbnail palette PNG resized to twice the display size (sharp on high-DPI
+                screens), a few KB instead of the 10-130 KB SVG markup
+  png_data_uri  the thumbnail as a data: URI, for the folium map markers
+  show_logo     draws a logo on a page: st.image with the PNG thumbnail, which
+                Streamlit serves from its media endpoint so a rerun only resends a
+                URL; the SVG markup when no PNG (or Pillow) is available
+Every variant sits in an LRU cache keyed by (logo directory, team, size).
+"""
+import io
+import os
+import re
+import base64
+from functools import lru_cache
+import streamlit as st
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+VARIANT_CACHE_SIZE = 256
+THUMBNAIL_COLORS = 128
+
+_SVG_ROOT = re.compile(r'<svg\b[^>]*>', re.S)
+_SVG_STRIP = [
+    re.compile(r'<\?xml.*?\?>', re.S),
+    re.compile(r'<!--.*?-->', re.S),
+    re.compile(r'<metadata\b.*?</metadata>', re.S),
+    re.compile(r'<sodipodi:namedview\b.*?(/>|</sodipodi:namedview>)', re.S),
+]
+
+
+def logo_name(team):
+    """'Kansas City Chiefs' -> 'kansas-city-chiefs-logo'"""
+    return team.lower().replace(' ', '-') + '-logo'
+
+
+@lru_cache(maxsize=64)
+def _svg_source(logo_path, team):
+    """Logo SVG without prolog/metadata and with a viewBox, root width/height removed."""
+    try:
+        with open(os.path.join(logo_path, logo_name(team) + '.svg'), 'r') as f:
+            markup = f.read()
+    except Exception:
+        return ''
+    for pattern in _SVG_STRIP:
+        markup = pattern.sub('', markup)
+    markup = re.sub(r'>\s+<', '><', markup).strip()
+    root = _SVG_ROOT.search(markup)
+    if root is None:
+        return ''
+    tag = root.group(0)
+    if 'viewBox' not in tag:
+        width = re.search(r'\swidth="([\d.]+)"', tag)
+        height = re.search(r'\sheight="([\d.]+)"', tag)
+        if width and height:
+            tag = tag[:-1] + f' viewBox="0 0 {width.group(1)} {height.group(1)}">'
+    tag = re.sub(r'\s(width|height)="[^"]*"', '', tag)
+    return markup[:root.start()] + tag + markup[root.end():]
+
+
+@lru_cache(maxsize=VARIANT_CACHE_SIZE)
+def svg_markup(logo_path, team, size):
+    """Inline SVG scaled to size x size px ('' when the team has no SVG logo)."""
+    source = _svg_source(logo_path, team)
+    if not source:
+        return ''
+    return source.replace('<svg', f'<svg width="{size}" height="{size}"', 1)
+
+
+@lru_cache(maxsize=VARIANT_CACHE_SIZE)
+def png_thumbnail(logo_path, team, size):
+    """PNG bytes of the logo fitted into 2*size x 2*size px, or None."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(os.path.join(logo_path, logo_name(team) + '.png')) as img:
+            img = img.convert('RGBA')
+            img.thumbnail((2 * size, 2 * size), Image.LANCZOS)
+            # flat-colour artwork: a 128-colour palette keeps it sharp at ~1/4 of the bytes
+            img = img.quantize(colors=THUMBNAIL_COLORS, method=Image.Quantize.FASTOCTREE)
+            out = io.BytesIO()
+            img.save(out, format='PNG', optimize=True)
+            return out.getvalue()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=VARIANT_CACHE_SIZE)
+def png_data_uri(logo_path, team, size):
+    png = png_thumbnail(logo_path, team, size)
+    if png is None:
+        return None
+    return 'data:image/png;base64,' + base64.b64encode(png).decode('ascii')
+
+
+def show_logo(logo_path, team, size):
+    """Draw the logo at size px in the current container; False when there is none."""
+    png = png_thumbnail(logo_path, team, size)
+    if png is not None:
+        st.image(png, width=size)
+        return True
+    markup = svg_markup(logo_path, team, size)
+    if markup:
+        st.markdown(f'''<div style="width: {size}px; height: {size}px; display:flex; align-items:center; justify-content:center;">{markup}</div>''', unsafe_allow_html=True)
+        return True
+    return False
@@ -1,12 +1,18 @@
 # main.py
 import streamlit as st
-from data_loader import load_data
+from data_loader import load_data, data_fingerprint
 from screens import home, upcoming_games, team, player, bets, fantasy_football
 
 st.set_page_config(layout="wide", page_title="NFL Stats Dashboard")
 
-# Load data once
-data = load_data()
+# Load data once per process: every session shares the same snapshot (its array values
+# are read-only, see utils.freeze), rebuilt only when a file under data/, games/ or
+# metadata/ changes
+@st.cache_resource(max_entries=1, show_spinner="Loading data...")
+def _load_snapshot(fingerprint):
+    return load_data()
+
+data = _load_snapshot(data_fingerprint())
 
 # Sidebar page selection (keeps original order)
 page = st.sidebar.selectbox(
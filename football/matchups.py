@@ -0,0 +1,228 @@
+# matchups.py
+"""
+Offense/defense cube for the matchup page, built once per snapshot from the
+player-week rows and the team-game table (data['team_games']).
+
+  plays    one row per player-week with yards > 0 in a completed game of the current
+           season, per stat: stat, team, opponent, year_week, Player, yards and the
+           player's season total (season_yards). Sorted by (stat, team, year_week).
+  week_max largest weekly yards per (stat, side, team), for the chart axis limits:
+           side 'offense' is what the team gained, 'defense' what it allowed (its
+           opponent's offense that week).
+  leaders  per (stat, team): the player with the highest season total among the team's
+           plays, their average per game, their yards in the team's latest week and
+           the trend (latest minus average), for all teams at once.
+
+A team's plays on either side are a lookup in a position index, so switching games
+does no merges over the player-week frame.
+
+matchup_view derives everything the page shows for one game (records, average
+scores, top players, chart frames, axis limits). MatchupCache keeps those views in an
+LRU per snapshot; load_data prefetches the upcoming games on a background pool so the
+first visitors on game day find them ready.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import sql_backend
+from utils import freeze
+
+MATCHUP_STATS = ['Passing_Yds', 'Rushing_Yds', 'Receiving_Yds']
+SIDES = {'offense': 'team', 'defense': 'opponent'}
+MATCHUP_CACHE_SIZE = 64
+PRECOMPUTE_WORKERS = 4
+
+# shared by every snapshot's MatchupCache
+_POOL = ThreadPoolExecutor(max_workers=PRECOMPUTE_WORKERS, thread_name_prefix='matchups')
+
+
+class MatchupCube:
+    def __init__(self, df, team_games):
+        games = team_games[['year_week', 'team', 'opponent']].reset_index(drop=True)
+        columns = ['Player', 'Real_Team', 'year_week'] + MATCHUP_STATS + ['Season_' + s for s in MATCHUP_STATS]
+        rows = df[[c for c in columns if c in df.columns]]
+        rows = rows[rows['year_week'].isin(games['year_week'].unique())]
+        rows = pd.DataFrame({c: rows[c].astype(str) if c in ('Player', 'Real_Team', 'year_week') else rows[c] for c in rows.columns})
+        rows = pd.merge(rows, games, how='inner', left_on=['year_week', 'Real_Team'], right_on=['year_week', 'team'])
+
+        parts = []
+        for stat in MATCHUP_STATS:
+            if stat not in rows.columns:
+                continue
+            part = rows[rows[stat] > 0]
+            parts.append(pd.DataFrame({
+                'stat': stat,
+                'team': part['team'],
+                'opponent': part['opponent'],
+                'year_week': part['year_week'],
+                'Player': part['Player'],
+                'yards': part[stat],
+                'season_yards': part.get('Season_' + stat, np.nan),
+            }))
+        plays = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(
+            columns=['stat', 'team', 'opponent', 'year_week', 'Player', 'yards', 'season_yards'])
+        plays = plays.sort_values(['stat', 'team', 'year_week'], kind='stable').reset_index(drop=True)
+        self.plays = freeze(plays)
+
+        self.positions = {}
+        self.week_max = {}
+        for side, key in SIDES.items():
+            index = plays.groupby(['stat', key]).indices
+            for (stat, team), positions in index.items():
+                positions.flags.writeable = False
+                self.positions[(stat, side, team)] = positions
+            weekly = plays.groupby(['stat', key, 'year_week'])['yards'].sum()
+            for (stat, team), value in weekly.groupby(level=[0, 1]).max().items():
+                self.week_max[(stat, side, team)] = value
+
+        self.leaders = _leaders(plays)
+
+    def team_plays(self, stat, team, side):
+        """Plays of stat where team is on offense ('offense') or defending ('defense')."""
+        positions = self.positions.get((stat, side, team))
+        if positions is None:
+            return self.plays.iloc[0:0]
+        return self.plays.take(positions)
+
+    def axis_limit(self, stat, teams, step=50):
+        """Largest weekly total either side of any of teams reached, rounded to step."""
+        values = [self.week_max[(stat, side, team)] for team in teams for side in SIDES if (stat, side, team) in self.week_max]
+        return round(max(values) / step) * step if values else 0
+
+
+def _leaders(plays):
+    """{(stat, team): (player, average, latest week's yards, trend)} from all plays at once."""
+    players = plays.groupby(['stat', 'team', 'Player'], sort=False).agg(
+        season_yards=('season_yards', 'max'), average=('yards', 'mean')).reset_index()
+    # ties on the season total go to the first name alphabetically
+    players = players.sort_values(['stat', 'team', 'season_yards', 'Player'], ascending=[True, True, False, True], kind='stable')
+    top = players.drop_duplicates(['stat', 'team'])
+    latest = plays.groupby(['stat', 'team'], sort=False)['year_week'].max().rename('latest').reset_index()
+    top = pd.merge(top, latest, how='left', on=['stat', 'team'])
+    last = plays.drop_duplicates(['stat', 'team', 'Player', 'year_week'])[['stat', 'team', 'Player', 'year_week', 'yards']]
+    top = pd.merge(top, last, how='left', left_on=['stat', 'team', 'Player', 'latest'], right_on=['stat', 'team', 'Player', 'year_week'])
+    average = top['average'].round(1).to_numpy()
+    last_week = top['yards'].fillna(0).to_numpy()
+    trend = np.round(last_week - average, 1)
+    return {(stat, team): (player, average[i], last_week[i], trend[i])
+            for i, (stat, team, player) in enumerate(zip(top['stat'], top['team'], top['Player']))}
+
+
+def _games_of(team_games, team):
+    return team_games.loc[[team]] if team in team_games.index else team_games.iloc[0:0]
+
+
+def _summary(games):
+    """Record ('W-L', '-T' when there are ties) and average points for/against, rounded."""
+    wins = int((games['result'] == 'Win').sum())
+    losses = int((games['result'] == 'Loss').sum())
+    ties = int((games['result'] == 'Tie').sum())
+    return {
+        'record': f"{wins}-{losses}" + (f"-{ties}" if ties else ""),
+        'score': round(games['points_for'].mean(), 1) if not games.empty else np.nan,
+        'allowed': round(games['points_against'].mean(), 1) if not games.empty else np.nan,
+    }
+
+
+def _labeled(plays, yard_type, searched_team, category):
+    return pd.DataFrame({
+        'year_week': plays['year_week'].to_numpy(),
+        'Player': plays['Player'].to_numpy(),
+        yard_type: plays['yards'].to_numpy(),
+        'Season_' + yard_type: plays['season_yards'].to_numpy(),
+        'searched_team': searched_team,
+        'team_category': category,
+    })
+
+
+def _side_frames(cube, sql_con, season, yard_type, away_team, home_team):
+    """Rows behind the away chart (Offense away + Defense home) and the home chart."""
+    if sql_con is not None:
+        # join and filter inside the embedded database
+        past = sql_backend.matchup_past(sql_con, yard_type, away_team, home_team, season)
+        df_awayteam = past[past['team_category'].isin(['Offense ' + away_team, 'Defense ' + home_team])]
+        df_hometeam = past[past['team_category'].isin(['Offense ' + home_team, 'Defense ' + away_team])]
+        return df_awayteam, df_hometeam
+    # the head-to-head game counts once, from the home side
+    away_off = cube.team_plays(yard_type, away_team, 'offense')
+    away_def = cube.team_plays(yard_type, away_team, 'defense')
+    df_awayteam = pd.concat([
+        _labeled(away_off[away_off['opponent'] != home_team], yard_type, away_team, 'Offense ' + away_team),
+        _labeled(cube.team_plays(yard_type, home_team, 'defense'), yard_type, home_team, 'Defense ' + home_team)], ignore_index=True)
+    df_hometeam = pd.concat([
+        _labeled(cube.team_plays(yard_type, home_team, 'offense'), yard_type, home_team, 'Offense ' + home_team),
+        _labeled(away_def[away_def['team'] != home_team], yard_type, away_team, 'Defense ' + away_team)], ignore_index=True)
+    return df_awayteam, df_hometeam
+
+
+def _weekly_totals(df_team, yard_type):
+    return df_team.groupby(['year_week','Player','team_category'], observed=True).agg({yard_type: 'sum'}).reset_index().sort_values(['year_week', yard_type], ascending=[True, False])
+
+
+def matchup_view(data, away_team, home_team):
+    """
+    Everything the matchup page shows for away_team @ home_team:
+      teams    {'away'|'home': record, average score, average allowed}
+      limits   {stat: chart axis limit}
+      totals   {stat: (away chart frame, home chart frame)}
+      leaders  {stat: (away top player, home top player)}, see MatchupCube.leaders
+    """
+    cube = data['matchups']
+    sql_con = sql_backend.connect(data['sql_path']) if data.get('sql_path') else None
+    view = {
+        'teams': {'away': _summary(_games_of(data['team_games'], away_team)),
+                  'home': _summary(_games_of(data['team_games'], home_team))},
+        'limits': {}, 'totals': {}, 'leaders': {},
+    }
+    try:
+        for yard_type in MATCHUP_STATS:
+            df_awayteam, df_hometeam = _side_frames(cube, sql_con, data['current_year'], yard_type, away_team, home_team)
+            view['limits'][yard_type] = cube.axis_limit(yard_type, [away_team, home_team])
+            view['totals'][yard_type] = (_weekly_totals(df_awayteam, yard_type), _weekly_totals(df_hometeam, yard_type))
+            view['leaders'][yard_type] = (cube.leaders.get((yard_type, away_team)), cube.leaders.get((yard_type, home_team)))
+    finally:
+        if sql_con is not None:
+            sql_con.close()
+    return view
+
+
+class MatchupCache:
+    """
+    LRU of matchup_view results for one snapshot, keyed by (away team, home team).
+    Entries are futures on the shared pool: a render that asks for a game still being
+    prefetched waits for that computation instead of starting its own.
+    """
+    def __init__(self, data, maxsize=MATCHUP_CACHE_SIZE):
+        self._data = data
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _future(self, away_team, home_team):
+        key = (away_team, home_team)
+        with self._lock:
+            future = self._entries.get(key)
+            if future is None:
+                future = _POOL.submit(matchup_view, self._data, away_team, home_team)
+                self._entries[key] = future
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            return future
+
+    def prefetch(self, games):
+        """Start computing every (away team, home team) in games in the background."""
+        for away_team, home_team in games:
+            self._future(away_team, home_team)
+
+    def get(self, away_team, home_team):
+        try:
+            return self._future(away_team, home_team).result()
+        except Exception:
+            # don't keep a failed computation; retry in the caller's thread
+            with self._lock:
+                self._entries.pop((away_team, home_team), None)
+            return matchup_view(self._data, away_team, home_team)
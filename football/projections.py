@@ -0,0 +1,76 @@
+# projections.py
+"""
+Full-season stat projections for every player of a season, from the season's
+leaderboard (leaderboards.SeasonBoard) and the completed games.
+
+A player's projection is their total so far plus their per-game average for each
+game their team still has left in the regular season:
+
+    projected = total + total / player_games * max(SEASON_GAMES - team_games, 0)
+
+All stats are projected at once on the board's (players x stats) array. Results are
+cached per season and completed week, so they are recomputed when a data refresh
+brings new games or stat changes, not per render.
+"""
+import numpy as np
+import pandas as pd
+from leaderboards import SUM_COLUMNS
+from utils import freeze, real_teams
+
+SEASON_GAMES = 17
+
+# season -> (completed week, board, projections)
+_PROJECTIONS = {}
+
+
+def completed_week(completed_games):
+    """year_week of the latest completed game ('' before the season starts)."""
+    if completed_games.empty or 'year_week' not in completed_games.columns:
+        return ''
+    return str(completed_games['year_week'].max())
+
+
+def team_games(completed_games):
+    """Completed games per team, keyed by full team name ('Kansas City Chiefs')."""
+    if completed_games.empty:
+        return pd.Series(dtype=int)
+    return completed_games['team1'].value_counts().add(completed_games['team2'].value_counts(), fill_value=0).astype(int)
+
+
+def project_board(board, completed_games):
+    """
+    Frame aligned with board.table: Player, Team, Games, Team_Games and one column per
+    stat with its full-season projection (rounded to whole units).
+    """
+    table = board.table
+    stats = [c for c in SUM_COLUMNS if c in table.columns]
+    totals = table[stats].to_numpy(dtype=float)
+    games = table['Games'].to_numpy(dtype=float)
+
+    # team games so far; never fewer than the player's own (traded players, missing schedule)
+    played = table['Team'].str[:3].map(real_teams).map(team_games(completed_games)).to_numpy(dtype=float)
+    played = np.fmax(np.nan_to_num(played, nan=0.0), games)
+    remaining = np.clip(SEASON_GAMES - played, 0, None)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_game = np.where(games[:, None] > 0, totals / games[:, None], 0.0)
+    projected = np.round(totals + per_game * remaining[:, None])
+
+    out = pd.DataFrame(projected, columns=stats)
+    out.insert(0, 'Team_Games', played.astype(int))
+    out.insert(0, 'Games', games.astype(int))
+    out.insert(0, 'Team', table['Team'].to_numpy())
+    out.insert(0, 'Player', table['Player'].to_numpy())
+    return freeze(out)
+
+
+def season_projections(board, completed_games):
+    """Projections for board's season, reused while neither the board nor the completed week changed."""
+    week = completed_week(completed_games)
+    cached = _PROJECTIONS.get(board.season)
+    if cached is not None and cached[0] == week and cached[1] is board:
+        return cached[2]
+    projections = project_board(board, completed_games)
+    _PROJECTIONS.clear()
+    _PROJECTIONS[board.season] = (week, board, projections)
+    return projections
@@ -0,0 +1,111 @@
+# schema.py
+"""
+Declared column types for the per-season player stat files in data/.
+Used when parsing the CSVs, when reading/writing the columnar season store and
+for the compact in-memory frame that load_data returns.
+"""
+import numpy as np
+import pandas as pd
+
+# counting stats, always present and never blank in the scraped files
+INT_STAT_COLUMNS = [
+    'Passing_Cmp', 'Passing_Att', 'Passing_Yds', 'Passing_TD', 'Passing_Int',
+    'Passing_Sk', 'Passing_Yds.1',
+    'Rushing_Att', 'Rushing_Yds', 'Rushing_TD',
+    'Receiving_Tgt', 'Receiving_Rec', 'Receiving_Yds', 'Receiving_TD',
+    'Fumbles_Fmb', 'Fumbles_FL',
+]
+
+# stats that are blank when the player had no attempt (longest play, passer rating)
+FLOAT_STAT_COLUMNS = ['Passing_Lng', 'Passing_Rate', 'Rushing_Lng', 'Receiving_Lng']
+
+# game metadata repeated on every player row
+GAME_INT_COLUMNS = ['season', 'week', 'tm_score', 'opp_score']
+
+STRING_COLUMNS = [
+    'Player', 'Team', 'boxscore_stats_link_', 'status', 'week_day', 'event_date', 'game_time',
+    'tm_nano', 'tm_market', 'tm_name', 'tm_alias', 'tm_alt_market', 'tm_alt_alias',
+    'opp_nano', 'opp_market', 'opp_name', 'opp_alias', 'opp_alt_market', 'opp_alt_alias',
+    'tm_location', 'opp_location', 'boxscore_stats_link',
+]
+
+READ_DTYPES = {}
+READ_DTYPES.update({c: 'int64' for c in INT_STAT_COLUMNS + GAME_INT_COLUMNS})
+READ_DTYPES.update({c: 'float64' for c in FLOAT_STAT_COLUMNS})
+READ_DTYPES.update({c: 'object' for c in STRING_COLUMNS})
+
+
+def read_dtypes(columns):
+    """
+    Dtype mapping for the given columns. Index artifacts from earlier re-saves
+    ('Unnamed: 0', 'Unnamed: 0.1', ...) are read as float like the concat produced before.
+    """
+    dtypes = {}
+    for col in columns:
+        if col in READ_DTYPES:
+            dtypes[col] = READ_DTYPES[col]
+        elif is_index_artifact(col):
+            dtypes[col] = 'float64'
+    return dtypes
+
+
+# Compact in-memory schema for the merged player-week frame (see compact()).
+# Player/team/game labels repeat on every row, so they are stored as categoricals.
+# year, week_padded and year_week stay plain strings: screens sort them, take their
+# max and build keys from them, which categoricals do not support the same way.
+CATEGORY_COLUMNS = [
+    'Player', 'Team', 'Real_Team', 'Player_Category', 'status', 'week_day', 'event_date', 'game_time',
+    'tm_nano', 'tm_market', 'tm_name', 'tm_alias', 'tm_alt_market', 'tm_alt_alias',
+    'opp_nano', 'opp_market', 'opp_name', 'opp_alias', 'opp_alt_market', 'opp_alt_alias',
+    'tm_location', 'opp_location', 'boxscore_stats_link_', 'boxscore_stats_link',
+]
+
+# per-game values fit comfortably in int16 (single-game yards, attempts, scores)
+DERIVED_STAT_COLUMNS = [
+    'Passing_Rushing_Yds', 'Rushing_Receiving_Yds', 'Passing_Rushing_Receiving_Yds',
+    'Rushing_Receiving_TD', 'Targets_not_caught',
+]
+COMPACT_DTYPES = {}
+COMPACT_DTYPES.update({c: 'int16' for c in INT_STAT_COLUMNS + DERIVED_STAT_COLUMNS})
+COMPACT_DTYPES.update({'season': 'int16', 'week': 'int8', 'tm_score': 'int16', 'opp_score': 'int16'})
+# longest plays are whole yards (blank when none), exact in float32; the passer rating
+# has a decimal that float32 would show as 39.599998, so it stays float64
+COMPACT_DTYPES.update({c: 'float32' for c in FLOAT_STAT_COLUMNS if c != 'Passing_Rate'})
+# season and career sums outgrow int16; Season_* is float because of the left merge
+COMPACT_DTYPES.update({c: 'float32' for c in ['Season_Passing_Yds', 'Season_Rushing_Yds', 'Season_Receiving_Yds']})
+COMPACT_DTYPES.update({c: 'int32' for c in ['Total_Passing_Yds', 'Total_Rushing_Yds', 'Total_Receiving_Yds']})
+
+
+def is_index_artifact(col):
+    """'Unnamed: 0', 'Unnamed: 0.1', ... left behind by CSVs re-saved with their index."""
+    return str(col).startswith('Unnamed')
+
+
+def _fits(series, dtype):
+    if np.issubdtype(np.dtype(dtype), np.integer):
+        if series.isna().any():
+            return False
+        info = np.iinfo(dtype)
+        return series.empty or (series.min() >= info.min and series.max() <= info.max)
+    return True
+
+
+def compact(df):
+    """
+    Drop index artifacts and convert columns to COMPACT_DTYPES / categoricals.
+    Integer downcasts are skipped for a column whose values would not fit (or has
+    blanks), so an unexpected scrape never silently wraps around.
+    """
+    df = df.drop(columns=[c for c in df.columns if is_index_artifact(c)])
+    dtypes = {}
+    for col, dtype in COMPACT_DTYPES.items():
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and _fits(df[col], dtype):
+            dtypes[col] = dtype
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            dtypes[col] = 'category'
+    return df.astype(dtypes)
+
+
+def memory_mb(df):
+    return round(float(df.memory_usage(deep=True).sum()) / 1e6, 1)
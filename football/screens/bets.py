@@ -7,10 +7,26 @@ import plotly.express as px
 import matplotlib.pyplot as plt
 from streamlit_folium import st_folium
 import os
-from utils import highlight_team, real_teams, target_lines
+from utils import real_teams, target_lines, project, percent_gradient
+import sql_backend
+
+# player-week columns this page reads
+COLUMNS = [
+    'Player', 'year', 'year_week', 'Passing_Yds', 'Rushing_Yds', 'Receiving_Yds',
+    'Rushing_Receiving_Yds', 'Receiving_Rec', 'Passing_TD', 'Rushing_Receiving_TD',
+    'Receiving_Lng',
+]
 
 def render(data):
-    df = data['df'].copy()
+    sql_con = sql_backend.connect(data['sql_path']) if data.get('sql_path') else None
+    try:
+        _render(data, sql_con)
+    finally:
+        if sql_con is not None:
+            sql_con.close()
+
+def _render(data, sql_con):
+    df = project(data, COLUMNS)
     new_year = data['current_year']
     path = data['path']
     logo_path = data['logo_path']
@@ -33,45 +49,22 @@ def render(data):
         st.markdown("<br><br><br><br>", unsafe_allow_html=True)
         rush_rec_yd_input = st.number_input('Rushing + Receiving Yards Target:', min_value=0, max_value=300, value=0)
 
-        selected_years_df = df.loc[df['year'].isin(selected_options)]
-        num_games_bets = selected_years_df['year_week'].nunique()
-
-        def color_gradient(val):
-            if val >= 50:
-                # Transition from green to yellow as value goes from 66 to 100
-                red = int(255 * (1 - (val - 50) / 50))  # Red increases as val decreases from 100 to 66
-                green = 255  # Full green for values >= 66
-            elif 25 <= val < 50:
-                # Transition from yellow to red as value goes from 33 to 66
-                red = 255  # Full red
-                green = int(255 * ((val - 25) / 25))  # Green decreases as val decreases from 66 to 33
-            else:
-                # Full red for values below 33
-                red = 255
-                green = 0
-
-            color = f'rgba({red}, {green}, 0, 1)'  # RGB color from green to yellow to red
-            return f'background-color: {color}; color: black;'
+        current_players = data['leaderboards'][str(new_year)].table['Player'] if str(new_year) in selected_options and str(new_year) in data['leaderboards'] else []
 
         def bet_df(stat, target_input):
-
-            max_year_df = selected_years_df.groupby('Player').agg({'year': 'max'}).reset_index()
-            max_year_df = max_year_df.rename({'year':'year_max'},
-                                            axis=1)
-            df_count = selected_years_df.groupby('Player').count().reset_index()
-            df_count = df_count.rename({'year_week':'Total_games'},
-                                    axis=1)
-            df_stat = selected_years_df.loc[selected_years_df[stat]>=target_input]
-            df_stat = df_stat.groupby('Player').count().reset_index()
-            df_stat = df_stat.rename({'year_week':'Count_games'},
-                                    axis=1)
-            df_stat = pd.merge(df_stat, df_count[['Player','Total_games']],how='left',on='Player')
-            df_stat = pd.merge(df_stat, max_year_df[['Player','year_max']],how='left',on='Player')
-            df_stat = df_stat.loc[df_stat['year_max']==str(new_year)]
+            if sql_con is not None:
+                # counted inside the embedded database; only the per-player result comes back
+                df_final = sql_backend.bet_counts(sql_con, stat, target_input, selected_options, new_year)
+                return df_final.style.apply(percent_gradient,subset=['% of Games']).format({'% of Games': '{:.1f}'})
+
+            # games at or over the target per player, a column of the alt-line ladder
+            df_stat = data['hit_rates'].table(stat, selected_options).frame(target_input)
+            # players with games this season that reached the target at least once
+            df_stat = df_stat.loc[(df_stat['Count_games'] > 0) & df_stat['Player'].isin(current_players)]
             df_stat['% of Games'] = round((df_stat['Count_games'] / df_stat['Total_games']) * 100, 1)
             df_stat = df_stat.sort_values(['Count_games','% of Games'], ascending=False).reset_index()
             df_final = df_stat[['Player','Count_games','Total_games','% of Games']]
-            df_final = df_final.style.applymap(color_gradient,subset=['% of Games']).format({'% of Games': '{:.1f}'})
+            df_final = df_final.style.apply(percent_gradient,subset=['% of Games']).format({'% of Games': '{:.1f}'})
             return df_final
         
 
@@ -6,10 +6,19 @@ import altair as alt
 import plotly.express as px
 import matplotlib.pyplot as plt
 import os
-from utils import highlight_team, real_teams, target_lines
+from utils import real_teams, target_lines, project, take_rows
+from leaderboards import fantasy_points
+
+# player-week columns this page reads
+COLUMNS = [
+    'Player', 'Team', 'Player_Category', 'year', 'week', 'tm_alias', 'tm_alt_alias',
+    'tm_market', 'tm_name', 'opp_market', 'opp_name', 'Passing_Yds', 'Passing_TD',
+    'Passing_Int', 'Rushing_Yds', 'Rushing_TD', 'Receiving_Rec', 'Receiving_Yds',
+    'Receiving_TD', 'Fumbles_FL',
+]
 
 def render(data):
-    df = data['df'].copy()
+    df = project(data, COLUMNS)
     # new_year = data['current_year']
     # path = data['path']
     # logo_path = data['logo_path']
@@ -31,29 +40,8 @@ def render(data):
         - 0.1 pt per rushing yard
         """
         df = df.copy()
-        df["half_ppr"] = (
-            df["Passing_Yds"] / 25 +
-            df["Passing_TD"] * 4 -
-            df["Passing_Int"] * 2 +
-            df["Rushing_Yds"] * 0.1 +
-            df["Rushing_TD"] * 6 +
-            df["Receiving_Rec"] * 0.5 +
-            df["Receiving_Yds"] * 0.1 +
-            df["Receiving_TD"] * 6 -
-            df["Fumbles_FL"] * 2
-        )
-
-        df["ppr"] = (
-            df["Passing_Yds"] / 25 +
-            df["Passing_TD"] * 4 -
-            df["Passing_Int"] * 2 +
-            df["Rushing_Yds"] * 0.1 +
-            df["Rushing_TD"] * 6 +
-            df["Receiving_Rec"] * 1 +
-            df["Receiving_Yds"] * 0.1 +
-            df["Receiving_TD"] * 6 -
-            df["Fumbles_FL"] * 2
-        )
+        df["half_ppr"] = fantasy_points(df, 0.5)
+        df["ppr"] = fantasy_points(df, 1)
         # return df
         return df[[
                 'Player',
@@ -76,31 +64,38 @@ def render(data):
                 ]]
 
     def identify_opponent(df):
-        df = df.copy()
+        # only adds columns, so a shallow copy of the read-only projection is enough
+        df = df.copy(deep=False)
+        # label columns are categoricals with different categories; compare/concatenate as strings
+        team = df['Team'].astype(str)
+        is_tm = (team == df['tm_alias'].astype(str)) | (team.str.lower() == df['tm_alt_alias'].astype(str))
+        tm_team = df['tm_market'].astype(str) + ' ' + df['tm_name'].astype(str)
+        opp_team = df['opp_market'].astype(str) + ' ' + df['opp_name'].astype(str)
 
                 # Create 'Player_team' column
-        df['Player_team'] = np.where((df['Team'] == df['tm_alias']) | (df['Team'].str.lower() == df['tm_alt_alias']), 
-                                    df['tm_market'] + ' ' + df['tm_name'], 
-                                    df['opp_market'] + ' ' + df['opp_name']
-                                    )
+        df['Player_team'] = np.where(is_tm, tm_team, opp_team)
 
         # Create 'Opposing_team' column
-        df['Opposing_team'] = np.where((df['Team'] == df['tm_alias']) | (df['Team'].str.lower() == df['tm_alt_alias']), 
-                                    df['opp_market'] + ' ' + df['opp_name'], 
-                                    df['tm_market'] + ' ' + df['tm_name']
-                                    )
+        df['Opposing_team'] = np.where(is_tm, opp_team, tm_team)
         return df
-    df = identify_opponent(df)
     selected_df = df.loc[(df['year'].isin(selected_options))]
 
-    calc_df = calculate_fantasy_points(selected_df)
+    # season half-PPR totals per (Player, year) from the shared leaderboards
+    # (leaderboards.SeasonBoard), and each player's average over the selected seasons
+    boards = [data['leaderboards'][y] for y in selected_options if y in data['leaderboards']]
+    sum_half_ppr_year = pd.concat(
+        [pd.DataFrame({'Player': b.table['Player'], 'year': b.season, 'total_half_ppr': b.table['half_ppr']}) for b in boards],
+        ignore_index=True) if boards else pd.DataFrame(columns=['Player', 'year', 'total_half_ppr'])
+    avg_half_ppr = sum_half_ppr_year.groupby('Player', as_index=False)[['total_half_ppr']].mean()
+    avg_half_ppr = avg_half_ppr.rename({'total_half_ppr':'avg_half_ppr'}, axis=1)
 
-    sum_half_ppr_year = calc_df.groupby(['Player','year'], as_index=False).sum()[['Player','year','half_ppr']]
-    sum_half_ppr_year = sum_half_ppr_year.rename({'half_ppr':'total_half_ppr'}, axis=1)
+    # one row per (Player, year, position) for the rankings, with the team they played for
+    player_seasons = identify_opponent(selected_df.drop_duplicates(['Player', 'year', 'Player_Category']))
+    calc_df = pd.DataFrame({'Player': player_seasons['Player'].astype(str),
+                            'Player_team': player_seasons['Player_team'],
+                            'Player_Category': player_seasons['Player_Category'],
+                            'year': player_seasons['year']})
     calc_df = pd.merge(calc_df, sum_half_ppr_year, how='left', on=['Player','year'])
-
-    avg_half_ppr = sum_half_ppr_year.groupby(['Player'], as_index=False).mean(numeric_only=True)[['Player','total_half_ppr']]
-    avg_half_ppr = avg_half_ppr.rename({'total_half_ppr':'avg_half_ppr'}, axis=1)
     calc_df = pd.merge(calc_df, avg_half_ppr, how='left', on='Player')
 
     # Filter by position
@@ -226,7 +221,13 @@ def render(data):
     
     selected_player = st.selectbox("Choose a Player For a Deeper Dive", combined_player_list)
 
-    filtered_player_df = filtered_df.loc[filtered_df['Player']==selected_player]
+    # per-game points only for the selected player's rows
+    player_rows = take_rows(data, 'player_year', [(selected_player, y) for y in selected_options], COLUMNS)
+    player_rows = player_rows[player_rows['Player_Category'] == position]
+    filtered_player_df = calculate_fantasy_points(identify_opponent(player_rows))
+    filtered_player_df['Player'] = filtered_player_df['Player'].astype(str)
+    filtered_player_df = pd.merge(filtered_player_df, sum_half_ppr_year, how='left', on=['Player','year'])
+    filtered_player_df = pd.merge(filtered_player_df, avg_half_ppr, how='left', on='Player')
 
     ######## DISTRIBUTION PLOTS ########
     # Calculate stats per year
@@ -2,17 +2,29 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from utils import real_teams
+from utils import real_teams, take_rows, project
+from chart_data import chart_frame, value_summary
 import altair as alt
 
+# player-week columns this page reads
+COLUMNS = [
+    'Player', 'Real_Team', 'year',
+]
+# columns of the selected player's rows (season totals and charts)
+PLAYER_COLUMNS = [
+    'Player', 'year', 'year_week', 'Season_Passing_Yds', 'Season_Rushing_Yds', 'Season_Receiving_Yds',
+    'Passing_Yds', 'Passing_TD', 'Passing_Cmp', 'Rushing_Yds', 'Rushing_Receiving_Yds',
+    'Rushing_Receiving_TD', 'Receiving_Yds', 'Receiving_Tgt', 'Receiving_Rec', 'Receiving_Lng',
+]
+
 def render(data):
     """
     Player page: show per-player time series and season summary.
     """
-    df = data['df'].copy()
+    df = project(data, COLUMNS)
     new_year = data['current_year']
     teams = data['teams']
-    color_df = data['color_df'].copy()
+    color_df = data['color_df'].copy(deep=False)
 
     title_col1, title_col2, title_col3, title_col4 = st.columns([4,1,0.9,8])
     with title_col1:
@@ -28,13 +40,10 @@ def render(data):
     except Exception:
         pass
     
+    # current-season rows for the selected team (empty for "All")
+    team_rows = take_rows(data, 'team_year', [(team_selected, str(new_year))], ['Player', 'Player_Category'])
     if team_selected in list(df['Real_Team'].unique()):
-        all_players = sorted(list(df.loc[ 
-                                    (df['Real_Team']==team_selected) &
-                                    (df['year']==str(new_year)),
-                                    'Player'].unique()
-                                  )
-                            )
+        all_players = sorted(list(team_rows['Player'].unique()))
     else:
         all_players = sorted(df['Player'].dropna().unique())
 
@@ -47,10 +56,7 @@ def render(data):
     with st.sidebar.expander("Select year(s)", expanded=False):
         selected_options = st.multiselect('Years', year_list, default=year_list)
 
-    player_stat = df.loc[
-                        (df['Player'] == player) &
-                        (df['year'].isin(selected_options))
-                    ].copy().reset_index()
+    player_stat = take_rows(data, 'player_year', [(player, y) for y in selected_options], PLAYER_COLUMNS).reset_index()
     
     season_pass = player_stat['Season_Passing_Yds'][0] 
     season_rush = player_stat['Season_Rushing_Yds'][0] 
@@ -59,15 +65,9 @@ def render(data):
     player_ht_page = 250
 
     ### ADDED INFO TO SIDEBAR ###
-    qb_active_list = sorted(list(df.loc[(df['Player_Category']=='Quarterback') & 
-                                  (df['Real_Team']==team_selected) &
-                                  (df['year']==str(new_year)),'Player'].unique()))
-    rb_active_list = sorted(list(df[(df['Player_Category']=='Running Back') & 
-                                  (df['Real_Team']==team_selected) &
-                                  (df['year']==str(new_year))]['Player'].unique()))
-    rec_active_list = sorted(list(df[(df['Player_Category']=='Receiver') & 
-                                  (df['Real_Team']==team_selected) &
-                                  (df['year']==str(new_year))]['Player'].unique()))
+    qb_active_list = sorted(list(team_rows.loc[team_rows['Player_Category']=='Quarterback','Player'].unique()))
+    rb_active_list = sorted(list(team_rows.loc[team_rows['Player_Category']=='Running Back','Player'].unique()))
+    rec_active_list = sorted(list(team_rows.loc[team_rows['Player_Category']=='Receiver','Player'].unique()))
 
     qb_sidebar = st.sidebar.write('QBs:',', '.join(qb_active_list))
     rb_sidebar = st.sidebar.write('RBs:',', '.join(rb_active_list))
@@ -88,32 +88,29 @@ def render(data):
         player_pos = "Receiver"
 
     # Num of games
-    num_games = df.loc[(df['year'].isin(selected_options) & (df['Player']==player)),'year_week'].nunique()
-
-    def target_lines(input_value,perc_of_games):
-        target_line = alt.Chart(pd.DataFrame({'y': [input_value], 'label': [f'Target: {input_value}, {perc_of_games} of games']})).mark_rule(color='purple').encode(
-                    y='y:Q'
-                ).properties(
-                    title='Target:'
-                )
-        target_label = target_line.mark_text(
-                align='right',
-                baseline='middle',
-                dx=-140,
-                dy=-10,
-            ).encode(
-                text='label:N',
-                size=alt.value(16)
-            )
-        return target_line, target_label
-    
-
+    num_games = player_stat['year_week'].nunique()
+
+    def reference_layers(base, value, text, color, **label_style):
+        """
+        A horizontal rule at value and its label, drawn from the chart's shared data
+        (aggregated to one row) instead of a one-row frame of their own.
+        """
+        one_row = base.transform_aggregate(rows='count()')
+        rule = one_row.mark_rule(color=color).encode(y=alt.datum(float(value)))
+        size = label_style.pop('size', None)
+        label = one_row.mark_text(baseline='middle', dy=-10, **label_style).encode(y=alt.datum(float(value)), text=alt.value(text))
+        if size is not None:
+            label = label.encode(size=alt.value(size))
+        return rule, label
+
+    def target_lines(base, input_value, perc_of_games):
+        return reference_layers(base, input_value, f'Target: {input_value}, {perc_of_games} of games', 'purple', align='right', dx=-140, size=16)
 
     col1, col2, col3 = st.columns([0.4,2,2])
 
     def year_legend(dataframe):
         if not dataframe.empty:
-            legend_chart = alt.Chart(dataframe).mark_point().encode(
+            legend_chart = alt.Chart(chart_frame(dataframe, 'year').drop_duplicates()).mark_point().encode(
                     color=alt.Color('year:O', scale=alt.Scale(
                         domain=sorted(dataframe['year'].unique(), reverse=True),  # Sort years in descending order
                         range=[team_color],  # Use the same color for all years
@@ -154,7 +151,10 @@ def render(data):
             else:
                 height = 250
             
-            yards_chart = alt.Chart(dataframe).mark_bar().encode(
+            # one compact dataset per chart; the reference rules are layered on it
+            frame = chart_frame(dataframe, 'year_week', yard_type, 'year', 'Player', season_yard_type)
+            base = alt.Chart()
+            yards_chart = base.mark_bar().encode(
                 x=alt.X('year_week:O',axis=alt.Axis(title=None)),
                 y=alt.Y(f'{yard_type}:Q',axis=alt.Axis(title=None)),
                 color=alt.value(team_color),
@@ -164,66 +164,27 @@ def render(data):
                     ), legend=None),
                 order=alt.Order(f'{season_yard_type}', sort='descending'),
                 tooltip=['Player', f'{yard_type}', 'year_week']
-            ).properties(
-                title=f'{title}',
-                height=height
             )
 
-            min_value = dataframe[f'{yard_type}'].min()
-            avg_value = round(dataframe[f'{yard_type}'].mean(),1)
-            max_value = dataframe[f'{yard_type}'].max()
-            # Add min, max, average lines
-            min_line = alt.Chart(pd.DataFrame({'y': [min_value], 'label': [f'Minimum: {min_value}']})).mark_rule(color='red').encode(
-                        y='y:Q'
-                    ).properties(
-                        title='Minimum'
-                    )
-            min_label = min_line.mark_text(
-                    align='left',
-                    baseline='middle',
-                    dx=280,
-                    dy=-10  # Adjust the position of the text
-                ).encode(
-                    text='label:N'
-                )
-
-            avg_line = alt.Chart(pd.DataFrame({'y': [avg_value], 'label': [f'Average: {avg_value}']})).mark_rule(color='blue').encode(
-                        y='y:Q'
-                    ).properties(
-                        title='Average'
-                    )
-            
-            avg_label = avg_line.mark_text(
-                    align='left',
-                    baseline='middle',
-                    dx=280,
-                    dy=-10
-                ).encode(
-                    text='label:N'
-                )
-
-            max_line = alt.Chart(pd.DataFrame({'y': [max_value], 'label': [f'Maximum: {max_value}']})).mark_rule(color='green').encode(
-                        y='y:Q'
-                    ).properties(
-                        title='Maximum'
-                    )
-            max_label = max_line.mark_text(
-                    align='left',
-                    baseline='middle',
-                    dx=280,
-                    dy=-10
-                ).encode(
-                    text='label:N'
-                )
-            
-            # count of values over target
-            games = dataframe.loc[dataframe[f'{yard_type}']>=yard_input,'year_week'].nunique()
+            # min, average and max in one pass; games at or over the target from the alt-line ladder
+            min_value, avg_value, max_value = value_summary(frame[yard_type])
+            games = data['hit_rates'].table(yard_type, selected_options).hits(player, yard_input)
             perc_games = "{:.0f}%".format((games / num_games)* 100)
-            target_line, target_label = target_lines(yard_input, perc_games)
-            
-
-            # Combine the base chart with the horizontal lines
-            final_chart = yards_chart + min_line + avg_line + max_line + target_line + min_label + avg_label + max_label + target_label
+            layers = [yards_chart]
+            labels = []
+            for value, text, color in [(min_value, f'Minimum: {min_value}', 'red'),
+                                       (avg_value, f'Average: {avg_value}', 'blue'),
+                                       (max_value, f'Maximum: {max_value}', 'green')]:
+                if not pd.isna(value):
+                    rule, label = reference_layers(base, value, text, color, align='left', dx=280)
+                    layers.append(rule)
+                    labels.append(label)
+            target_line, target_label = target_lines(base, yard_input, perc_games)
+
+            final_chart = alt.layer(*layers, target_line, *labels, target_label, data=frame).properties(
+                title=f'{title}',
+                height=height
+            )
             st.altair_chart(final_chart, use_container_width=True)
 
             return final_chart, games, perc_games, target_line, target_label
@@ -273,17 +234,15 @@ def render(data):
             receiving_yd_chart, rush_rec_games, rush_rec_perc_games, target_rush_rec_line, target_rush_rec_label = yards_chart(player_stat, rec_yd_input, "Receiving_Yds", "Receiving Yards")
 
             #  Reception and Target Chart
-            target_chart = alt.Chart(player_stat).mark_bar(color='lightgray').encode(
+            frame = chart_frame(player_stat, 'year_week', 'Receiving_Tgt', 'Receiving_Rec', 'year', 'Player')
+            base = alt.Chart()
+            target_chart = base.mark_bar(color='lightgray').encode(
                 x=alt.X('year_week:O',axis=alt.Axis(title=None)),
                 y=alt.Y('Receiving_Tgt:Q',axis=alt.Axis(title=None)),
                 order=alt.Order('Receiving_Tgt', sort='descending'),
                 tooltip=['Player', 'Receiving_Tgt', 'year_week']
-            ).properties(
-                title='Receptions',
-                width=600,
-                height=player_ht_page
             )
-            reception_chart = alt.Chart(player_stat).mark_bar().encode(
+            reception_chart = base.mark_bar().encode(
                 x=alt.X('year_week:O',axis=alt.Axis(title=None)),
                 y=alt.Y('Receiving_Rec:Q',axis=alt.Axis(title=None)),
                 color=alt.value(team_color),
@@ -296,15 +255,16 @@ def render(data):
             )
 
              # count of values over target
-            rec_games = player_stat.loc[player_stat['Receiving_Rec']>=reception_input,'year_week'].nunique()
+            rec_games = data['hit_rates'].table('Receiving_Rec', selected_options).hits(player, reception_input)
             rec_perc_games = "{:.0f}%".format((rec_games / num_games)* 100)
-            target_rec_line, target_rec_label = target_lines(reception_input,rec_perc_games)
-            
+            target_rec_line, target_rec_label = target_lines(base, reception_input, rec_perc_games)
+
+            st.altair_chart(alt.layer(target_chart, reception_chart, target_rec_line, target_rec_label, data=frame).properties(
+                                title='Receptions',
+                                width=600,
+                                height=player_ht_page
+                            ), use_container_width=True)
 
-            st.altair_chart(target_chart + reception_chart
-                            + target_rec_line + target_rec_label
-                            , use_container_width=True)
-            
 
             reception_length_chart, longest_yd_games, longest_yd_perc_games, target_longest_line, target_longest_label = yards_chart(player_stat, longest_yd_input, "Receiving_Lng","Longest Reception")
 
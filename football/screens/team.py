@@ -4,15 +4,25 @@ import altair as alt
 import pandas as pd
 import numpy as np
 import os
-from utils import real_teams
+import logos
+from utils import real_teams, take_rows, project
+from chart_data import stat_dataset, chart_frame
 import matplotlib.pyplot as plt
 
+# player-week columns this page reads
+COLUMNS = [
+    'Player', 'Player_Category', 'year', 'year_week', 'week', 'Passing_Yds', 'Rushing_Yds',
+    'Receiving_Yds', 'Passing_TD', 'Rushing_TD', 'Receiving_TD', 'Passing_Rushing_Yds',
+    'Rushing_Receiving_Yds', 'Receiving_Rec', 'Season_Passing_Yds', 'Season_Rushing_Yds',
+    'Season_Receiving_Yds',
+]
+
 def render(data):
     """
     Team page: shows team-level charts and per-player breakdowns.
     Expects data dict from data_loader.load_data()
     """
-    df = data['df'].copy()
+    df = project(data, COLUMNS)
     color_df = data['color_df']
     teams = data['teams']
     logo_path = data['logo_path']
@@ -30,26 +40,17 @@ def render(data):
     loser_ct = len(completed_games[completed_games['team2'] == team_selected])
     record = f"{winner_ct} - {loser_ct}"
 
-    # logo rendering
-    svg_selected = team_selected.lower().replace(' ', '-') + '-logo.svg'
-    svg_path = os.path.join(logo_path, svg_selected)
-    svg_content = ''
-    try:
-        with open(svg_path, 'r') as f:
-            svg_content = f.read().replace('width="700"', 'width="100"').replace('height="400"', 'height="100"')
-    except Exception:
-        svg_content = ''
-
+    # logo rendering (cached, pre-resized, served as a media URL)
     with title_col2:
-        if svg_content:
-            st.markdown(f'''<div style="width: 100px; height: 100px; overflow: hidden; display:flex; align-items:center; justify-content:center;">{svg_content}</div>''', unsafe_allow_html=True)
+        logos.show_logo(logo_path, team_selected, 100)
     with title_col3:
         st.metric('', record)
 
 
     # Build roster lists and active roster for the team
-    team_roster = sorted(list(df.loc[df['Real_Team'] == team_selected, 'Player'].unique()))
-    active_roster = sorted(list(df.loc[(df['year'] == str(new_year)) & (df['Real_Team'] == team_selected), 'Player'].unique()))
+    year_list = sorted(list(df['year'].unique()))
+    team_roster = sorted(list(take_rows(data, 'team_year', [(team_selected, y) for y in year_list], ['Player'])['Player'].unique()))
+    active_roster = sorted(list(take_rows(data, 'team_year', [(team_selected, str(new_year))], ['Player'])['Player'].unique()))
     active_roster_value = ', '.join(active_roster)
     active_roster_header = f"Team: {team_selected} | Active Roster:{active_roster_value}"
     st.markdown(f"<h5 style='font-size: 14px;'>{active_roster_header}</h5>", unsafe_allow_html=True)
@@ -71,7 +72,6 @@ def render(data):
                                         default=active_roster)
         
     # year multiselect
-    year_list = sorted(list(df['year'].unique()))
     with st.sidebar.expander("Select year(s)", expanded=False):
         selected_options = st.multiselect('Years', year_list, default=year_list)
 
@@ -104,6 +104,11 @@ def render(data):
     receiving_players = list(receiving['Player'].unique())
     receiving_mapping = {key: value for key, value in color_mapping.items() if key in receiving_players}                       
     
+    # chart data: one pruned (year_week, Player) frame per stat, shared by its charts
+    passing = stat_dataset(passing, ['year_week', 'Player'], ['Passing_Yds', 'Passing_TD', 'Passing_Rushing_Yds'], ['Season_Passing_Yds', 'week'])
+    rushing = stat_dataset(rushing, ['year_week', 'Player'], ['Rushing_Yds', 'Rushing_TD', 'Rushing_Receiving_Yds'], ['Season_Rushing_Yds', 'week'])
+    receiving = stat_dataset(receiving, ['year_week', 'Player'], ['Receiving_Yds', 'Receiving_TD', 'Receiving_Rec'], ['Season_Receiving_Yds', 'week'])
+
     # Create four columns for legend + three charts as in original
     col1, col2, col3, col4= st.columns([0.5,2,2,2])
 
@@ -118,7 +123,7 @@ def render(data):
         title = yard_type[:-4]
         season_label = 'Season_' + yard_type
         if not df.empty:
-            legend = alt.Chart(df).mark_bar(opacity=0).encode(
+            legend = alt.Chart(chart_frame(df, 'year_week', yard_type, 'Player', season_label, 'week')).mark_bar(opacity=0).encode(
                 x=alt.X('year_week:O',axis=alt.Axis(title=None)),
                 y=f'{yard_type}:Q',
                 color=alt.Color('Player:N', 
@@ -161,7 +166,7 @@ def render(data):
         title = yard_type[:-4] + ' Yards'
         season_label = 'Season_' + yard_type
         if not df.empty:
-            yds_chart = alt.Chart(df).mark_bar().encode(
+            yds_chart = alt.Chart(chart_frame(df, 'year_week', yard_type, 'Player', season_label)).mark_bar().encode(
                 x=alt.X('year_week:O', axis=alt.Axis(title=None)),
                 y=alt.Y(f'{yard_type}:Q', axis=alt.Axis(title=None)),
                 color=alt.Color('Player:N', scale=alt.Scale(domain=list(mapping.keys()), range=list(mapping.values())), legend=None),
@@ -186,7 +191,7 @@ def render(data):
         td_type = yds_type[:-3] + 'TD'
         season_label = 'Season_' + yds_type
         if not df.empty:
-            td_chart = alt.Chart(df).mark_bar().encode(
+            td_chart = alt.Chart(chart_frame(df, 'year_week', td_type, 'Player', season_label)).mark_bar().encode(
                 x=alt.X('year_week:O', axis=alt.Axis(title=None)),
                 y=alt.Y(f'{td_type}:Q', axis=alt.Axis(title=None)),
                 color=alt.Color('Player:N', scale=alt.Scale(domain=list(mapping.keys()), range=list(mapping.values())), legend=None),
@@ -210,7 +215,7 @@ def render(data):
         title = title_split[0] + ' + ' + title_split[1] + ' Yards'
         season_label = 'Season_' + yds_type[:7] + '_Yds'
         if not df.empty:
-            other_yds_chart = alt.Chart(df).mark_bar().encode(
+            other_yds_chart = alt.Chart(chart_frame(df, 'year_week', yds_type, 'Player', season_label)).mark_bar().encode(
                 x=alt.X('year_week:O',axis=alt.Axis(title=None)),
                 y=alt.Y(f'{yds_type}:Q',axis=alt.Axis(title=None)),
                 color=alt.Color('Player:N', scale=alt.Scale(domain=list(mapping.keys()), range=list(mapping.values())),legend=None),
@@ -232,7 +237,7 @@ def render(data):
         rushing_receiving_yds_chart = other_bar_chart(rushing, rushing_mapping, 'Rushing_Receiving_Yds')
 
     ### OTHER BAR CHART - RECEIVING
-        receiving_target_chart = alt.Chart(receiving).mark_bar().encode(
+        receiving_target_chart = alt.Chart(chart_frame(receiving, 'year_week', 'Receiving_Rec', 'Player', 'Season_Receiving_Yds')).mark_bar().encode(
             x=alt.X('year_week:O',axis=alt.Axis(title=None)),
             y=alt.Y('Receiving_Rec:Q',axis=alt.Axis(title=None)),
             color=alt.Color('Player:N', scale=alt.Scale(domain=list(receiving_mapping.keys()), range=list(receiving_mapping.values())),legend=None),
@@ -5,17 +5,17 @@ import numpy as np
 from datetime import datetime
 import altair as alt
 import os
+import logos
 
 def render(data):
-    df = data['df'].copy()
-    upcoming_games = data['upcoming_games'].copy()
-    completed_games = data['completed_games'].copy()
-    color_df = data['color_df'].copy()
+    # no player-week columns: the matchup views come from data['matchup_cache']
+    upcoming_games = data['upcoming_games'].copy(deep=False)
+    color_df = data['color_df'].copy(deep=False)
     logo_path = data['logo_path']
 
     st.title("Upcoming Games")
     # distinct teams
-    teams = sorted(list(df['Real_Team'].unique()))
+    teams = data['teams']
     team_selected = st.sidebar.selectbox("Select a team", teams)
     upcoming_games = upcoming_games[upcoming_games['Home_Team'].str.contains(team_selected) | upcoming_games['Away_Team'].str.contains(team_selected)].reset_index()
 
@@ -28,61 +28,12 @@ def render(data):
     away_team = game.split('@')[0].strip()
     home_team = game.split('@')[1].strip()
 
-    # Build completed_games_sub (same logic as original)
-    completed_games['opponent_team'] = np.nan
-    completed_games['searched_team'] = np.nan
-    completed_games['opponent_score'] = np.nan
-    completed_games['team_score'] = np.nan
-
-    # populate for both away & home
-    for team in [away_team, home_team]:
-        # Mask for when this team is team1 or team2
-        mask_team1 = completed_games['team1'] == team
-        mask_team2 = completed_games['team2'] == team
-        
-        # Opponent team
-        completed_games.loc[mask_team1, 'opponent_team'] = completed_games.loc[mask_team1, 'team2']
-        completed_games.loc[mask_team2, 'opponent_team'] = completed_games.loc[mask_team2, 'team1']
-        
-        # Searched team
-        completed_games.loc[mask_team1, 'searched_team'] = completed_games.loc[mask_team1, 'team1']
-        completed_games.loc[mask_team2, 'searched_team'] = completed_games.loc[mask_team2, 'team2']
-        
-        # Scores
-        completed_games.loc[mask_team1, 'opponent_score'] = completed_games.loc[mask_team1, 'opp_score']
-        completed_games.loc[mask_team2, 'opponent_score'] = completed_games.loc[mask_team2, 'tm_score']
-        completed_games.loc[mask_team1, 'team_score'] = completed_games.loc[mask_team1, 'tm_score']
-        completed_games.loc[mask_team2, 'team_score'] = completed_games.loc[mask_team2, 'opp_score']
-
-    completed_games_sub = completed_games[['year_week','opponent_team','searched_team','opponent_score','team_score']].copy()
-    completed_scores = completed_games_sub[completed_games_sub['opponent_team'].notnull()].copy()
-    completed_scores['WinLoss'] = 'Loss'
-    completed_scores.loc[(completed_scores['opponent_score'] - completed_scores['team_score']) < 0, 'WinLoss'] = 'Win'
-    avg_scores = completed_scores.groupby(['searched_team']).agg({'team_score':'mean','opponent_score':'mean'}).reset_index()
-
-    # Defense/offense past merging (like original)
-    passing = df[df['Passing_Yds'] > 0].copy()
-    rushing = df[df['Rushing_Yds'] > 0].copy()
-    receiving = df[df['Receiving_Yds'] > 0].copy()
-
-    def combine_info(df, yard_type):
-        defense = pd.merge(df, completed_games_sub, how='inner', left_on=['year_week','Real_Team'], right_on=['year_week','opponent_team'])
-        defense['team_category'] = 'Defense ' + defense['searched_team']
-        offense = pd.merge(df, completed_games_sub, how='inner', left_on=['year_week','Real_Team'], right_on=['year_week','searched_team'])
-        offense['team_category'] = 'Offense ' + offense['searched_team']
-        past = pd.concat([offense, defense], axis=0)
-
-        df_awayteam = past[past['team_category'].isin(['Offense ' + away_team, 'Defense ' + home_team])]
-        df_hometeam = past[past['team_category'].isin(['Offense ' + home_team, 'Defense ' + away_team])]
-
-        total_df_away = df_awayteam.groupby(['year_week','Player','team_category']).agg({f'{yard_type}':'sum'}).reset_index().sort_values(['year_week',f'{yard_type}'], ascending=[True, False])
-        total_df_home = df_hometeam.groupby(['year_week','Player','team_category']).agg({f'{yard_type}':'sum'}).reset_index().sort_values(['year_week',f'{yard_type}'], ascending=[True, False])
-        
-        return defense, offense, past, df_awayteam, df_hometeam, total_df_away, total_df_home
-
-    passing_def, passing_off, passing_past, passing_awayteam, passing_hometeam, total_passing_away, total_passing_home = combine_info(passing, 'Passing_Yds')
-    rushing_def, rushing_off, rushing_past, rushing_awayteam, rushing_hometeam, total_rushing_away, total_rushing_home = combine_info(rushing, 'Rushing_Yds')
-    receiving_def, receiving_off, receiving_past, receiving_awayteam, receiving_hometeam, total_rec_away, total_rec_home = combine_info(receiving, 'Receiving_Yds')
+    # derived data for this game, usually prefetched in the background by load_data
+    view = data['matchup_cache'].get(away_team, home_team)
+    away, home = view['teams']['away'], view['teams']['home']
+    total_passing_away, total_passing_home = view['totals']['Passing_Yds']
+    total_rushing_away, total_rushing_home = view['totals']['Rushing_Yds']
+    total_rec_away, total_rec_home = view['totals']['Receiving_Yds']
 
     # basic header metrics and logos
     othercols = st.columns([3.5,1.6,1.5,1.2,1,1.5,3])
@@ -97,50 +48,25 @@ def render(data):
         st.metric('', formatted_event)
 
     # avg scores metrics
-    away_score = round(avg_scores.loc[avg_scores['searched_team'] == away_team, 'team_score'].values[0], 1) if not avg_scores[avg_scores['searched_team'] == away_team].empty else np.nan
-    home_score = round(avg_scores.loc[avg_scores['searched_team'] == home_team, 'team_score'].values[0], 1) if not avg_scores[avg_scores['searched_team'] == home_team].empty else np.nan
+    away_score = away['score']
+    home_score = home['score']
     with othercols[1]:
-        away_score_against = round(avg_scores.loc[avg_scores['searched_team'] == away_team, 'opponent_score'].values[0], 1) if not avg_scores[avg_scores['searched_team'] == away_team].empty else np.nan
-        away_vs = away_score - away_score_against if (not np.isnan(away_score) and not np.isnan(away_score_against)) else np.nan
+        away_vs = away_score - away['allowed'] if (not np.isnan(away_score) and not np.isnan(away['allowed'])) else np.nan
         away_vs = round(away_vs, 1)
         st.metric("Average Score (Away)", away_score, f"{away_vs}, Avg Differential")
     with othercols[2]:
         # show away logo & record
-        away_svg = away_team.lower().replace(' ', '-') + '-logo.svg'
-        away_svg_path = os.path.join(logo_path, away_svg)
-        svg_content = ''
-        try:
-            with open(away_svg_path, 'r') as f:
-                svg_content = f.read().replace('width="700"', 'width="100"').replace('height="400"', 'height="100"')
-        except Exception:
-            svg_content = ''
-        if svg_content:
-            st.markdown(f'''<div style="width: 75px; height: 75px; display:flex; align-items:center; justify-content:center;">{svg_content}</div>''', unsafe_allow_html=True)
-        away_wins = completed_scores[(completed_scores['WinLoss']=='Win') & (completed_scores['searched_team']==away_team)]['year_week'].count()
-        away_losses = completed_scores[(completed_scores['WinLoss']=='Loss') & (completed_scores['searched_team']==away_team)]['year_week'].count()
-        away_record = str(away_wins) + "-" + str(away_losses)
-        st.markdown(f'''<div style="width: 75px; height: 10px;  justify-content: center;text-align: center;">{away_record}</div>''', unsafe_allow_html=True)
+        logos.show_logo(logo_path, away_team, 75)
+        st.markdown(f'''<div style="width: 75px; height: 10px;  justify-content: center;text-align: center;">{away['record']}</div>''', unsafe_allow_html=True)
 
     with othercols[3]:
         st.metric('', "@")
     with othercols[4]:
-        home_svg = home_team.lower().replace(' ', '-') + '-logo.svg'
-        home_svg_path = os.path.join(logo_path, home_svg)
-        svg_content = ''
-        try:
-            with open(home_svg_path, 'r') as f:
-                svg_content = f.read().replace('width="700"', 'width="100"').replace('height="400"', 'height="100"')
-        except Exception:
-            svg_content = ''
-        if svg_content:
-            st.markdown(f'''<div style="width: 75px; height: 75px; display:flex; align-items:center; justify-content:center;">{svg_content}</div>''', unsafe_allow_html=True)
-        home_wins = completed_scores[(completed_scores['WinLoss']=='Win') & (completed_scores['searched_team']==home_team)]['year_week'].count()
-        home_losses = completed_scores[(completed_scores['WinLoss']=='Loss') & (completed_scores['searched_team']==home_team)]['year_week'].count()
-        home_record = str(home_wins) + "-" + str(home_losses)
-        st.markdown(f'''<div style="width: 75px; height: 10px;  justify-content: center;text-align: center;">{home_record}</div>''', unsafe_allow_html=True)
+        logos.show_logo(logo_path, home_team, 75)
+        st.markdown(f'''<div style="width: 75px; height: 10px;  justify-content: center;text-align: center;">{home['record']}</div>''', unsafe_allow_html=True)
 
     with othercols[5]:
-        home_vs = (home_score - (round(avg_scores.loc[avg_scores['searched_team'] == home_team, 'opponent_score'].values[0],1) if not avg_scores[avg_scores['searched_team'] == home_team].empty else 0))
+        home_vs = (home_score - (home['allowed'] if not np.isnan(home['allowed']) else 0))
         st.metric("Average Score (Home)", home_score, f"{home_vs}, Avg Differential")
 
     st.markdown("---")
@@ -161,30 +87,17 @@ def render(data):
 #########################################
     up_col1 , up_col2 , up_col3, up_col4 = st.columns([1, 5, 5, 1])
 
-    max_pass_value = passing_past.groupby(['year_week','team_category']).sum()['Passing_Yds'].max()
-    pass_limit = round(max_pass_value / 50) * 50
-    max_rush_value = rushing_past.groupby(['year_week','team_category']).sum()['Rushing_Yds'].max()
-    rush_limit = round(max_rush_value / 50) * 50
-    max_rec_value = receiving_past.groupby(['year_week','team_category']).sum()['Receiving_Yds'].max()
-    rec_limit = round(max_rec_value / 50) * 50
+    # axis limits: best weekly total either team gained or allowed
+    pass_limit = view['limits']['Passing_Yds']
+    rush_limit = view['limits']['Rushing_Yds']
+    rec_limit = view['limits']['Receiving_Yds']
     chart_ht = 225
 
-    def team_metrics(df_team, df_type_team, yard_type, title):
-        season_yard_type = 'Season_' + yard_type
-        top = df_type_team[df_type_team['searched_team']==df_team]
-        top_type = top.groupby(['Player']).agg({f'{season_yard_type}': 'max'})
-        top_type = top_type.reset_index().sort_values(f'{season_yard_type}', ascending=False)['Player'].values[0]
-        top_type_avg = top[top['Player']==top_type].groupby(['Player']).agg({f'{yard_type}': 'mean'}).reset_index()[f'{yard_type}'].values[0]
-        top_type_avg = round(top_type_avg,1)
-        latest_year_week = top.sort_values('year_week',ascending=False)['year_week'].values[0]
-        last_week_type_yds = top.loc[(top['Player']==top_type) & (top['year_week']==latest_year_week),f'{yard_type}']
-        if not last_week_type_yds.empty:
-            last_week_type_yds = last_week_type_yds.values[0]
-        else:
-            last_week_type_yds = 0
-        type_yds_diff = round(last_week_type_yds - top_type_avg,1)
-        st.write(f"Top {title}")
-        st.metric(top_type,top_type_avg,f"{type_yds_diff} Trending")
+    def team_metrics(leader, title):
+        if leader is not None:
+            top_type, top_type_avg, last_week_type_yds, type_yds_diff = leader
+            st.write(f"Top {title}")
+            st.metric(top_type,top_type_avg,f"{type_yds_diff} Trending")
 
         st.write("")
         st.write("")
@@ -193,8 +106,6 @@ def render(data):
         st.write("")
         st.write("")
 
-        return top, top_type, top_type_avg, last_week_type_yds, type_yds_diff
-    
     def player_breakdown(total_type, yard_type, type_limit, top_team_color, bottom_team_color, orientation):
         title = 'Player ' + yard_type[:-4] + ' Yards per Week'
 
@@ -216,9 +127,9 @@ def render(data):
 
     # show trends for away team (passing, rushing, receiving)
     with up_col1:
-        away_top_pass, away_top_pass_qb, away_top_pass_avg, away_last_week_pass_yds, away_pass_yds_diff = team_metrics(away_team, passing_awayteam, "Passing_Yds", "Passer")
-        away_top_rush, away_top_rush_rb, away_top_rush_avg, away_last_week_rush_yds, away_rush_yds_diff = team_metrics(away_team, rushing_awayteam, "Rushing_Yds", "Rusher")
-        away_top_rec, away_top_rec_wr, away_top_rec_avg, away_last_week_rec_yds, away_rec_yds_diff = team_metrics(away_team, receiving_awayteam, "Receiving_Yds", "Receiver")
+        team_metrics(view['leaders']['Passing_Yds'][0], "Passer")
+        team_metrics(view['leaders']['Rushing_Yds'][0], "Rusher")
+        team_metrics(view['leaders']['Receiving_Yds'][0], "Receiver")
 
     # show three charts in center (passing, rushing, receiving) for away team
     with up_col2:
@@ -234,8 +145,8 @@ def render(data):
 
     # show trends for home team (passing, rushing, receiving)
     with up_col4:
-        home_top_pass, home_top_pass_qb, home_top_pass_avg, home_last_week_pass_yds, home_pass_yds_diff = team_metrics(home_team, passing_hometeam, "Passing_Yds", "Passer")
-        home_top_rush, home_top_rush_rb, home_top_rush_avg, home_last_week_rush_yds, home_rush_yds_diff = team_metrics(home_team, rushing_hometeam, "Rushing_Yds", "Rusher")
-        home_top_rec, home_top_rec_wr, home_top_rec_avg, home_last_week_rec_yds, home_rec_yds_diff = team_metrics(home_team, receiving_hometeam, "Receiving_Yds", "Receiver")
+        team_metrics(view['leaders']['Passing_Yds'][1], "Passer")
+        team_metrics(view['leaders']['Rushing_Yds'][1], "Rusher")
+        team_metrics(view['leaders']['Receiving_Yds'][1], "Receiver")
 
     st.success("Upcoming Games loaded.")
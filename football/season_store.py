@@ -0,0 +1,101 @@
+# season_store.py
+"""
+Columnar (Parquet) copy of the per-season player stat files.
+
+data/<year>_stats.csv is converted to data/columnar/<year>_stats.parquet, one file per
+season. The loader reads the Parquet file when it is at least as new as its CSV and
+falls back to parsing the CSV otherwise, so a stale or missing store is never wrong,
+only slower.
+
+Convert (or refresh) the store from the football/ directory with:
+    python season_store.py            # only seasons whose CSV changed
+    python season_store.py --force    # rewrite every season
+"""
+import os
+import argparse
+import pandas as pd
+from schema import READ_DTYPES, read_dtypes
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for pandas)
+except ImportError:
+    pyarrow = None
+
+STORE_DIR = 'columnar'
+
+
+def store_path(data_path, csv_name):
+    return os.path.join(data_path, STORE_DIR, os.path.splitext(csv_name)[0] + '.parquet')
+
+
+def _is_fresh(parquet_fp, csv_fp):
+    if not os.path.exists(parquet_fp):
+        return False
+    if not os.path.exists(csv_fp):
+        return True
+    return os.path.getmtime(parquet_fp) >= os.path.getmtime(csv_fp)
+
+
+def read_csv_season(csv_fp):
+    """Parse one season CSV with the declared dtypes."""
+    try:
+        return pd.read_csv(csv_fp, dtype=READ_DTYPES)
+    except (ValueError, TypeError):
+        # a column that should be whole numbers has blanks in this scrape; let pandas infer
+        return pd.read_csv(csv_fp)
+
+
+def read_season(data_path, csv_name):
+    """Read one season, from the columnar store when it is up to date."""
+    csv_fp = os.path.join(data_path, csv_name)
+    parquet_fp = store_path(data_path, csv_name)
+    if pyarrow is not None and _is_fresh(parquet_fp, csv_fp):
+        season = pd.read_parquet(parquet_fp)
+        return season.astype(read_dtypes(season.columns), copy=False)
+    return read_csv_season(csv_fp)
+
+
+def source_stamp(data_path, csv_name):
+    """(mtime, size) of a season's CSV and Parquet files; changes whenever either is rewritten."""
+    stamp = []
+    for fp in [os.path.join(data_path, csv_name), store_path(data_path, csv_name)]:
+        try:
+            st = os.stat(fp)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def season_files(data_path):
+    """Season file names (as <year>_stats.csv) found as CSV or in the columnar store."""
+    names = {f for f in os.listdir(data_path) if f.lower().endswith('.csv')}
+    store_dir = os.path.join(data_path, STORE_DIR)
+    if pyarrow is not None and os.path.isdir(store_dir):
+        names.update(os.path.splitext(f)[0] + '.csv' for f in os.listdir(store_dir) if f.endswith('.parquet'))
+    return sorted(names)
+
+
+def convert(data_path, force=False):
+    """Write a Parquet file for every season CSV that is new or changed. Returns written paths."""
+    if pyarrow is None:
+        raise ImportError("pyarrow is required to build the columnar season store (pip install pyarrow)")
+    os.makedirs(os.path.join(data_path, STORE_DIR), exist_ok=True)
+    written = []
+    for csv_name in sorted(f for f in os.listdir(data_path) if f.lower().endswith('.csv')):
+        parquet_fp = store_path(data_path, csv_name)
+        if not force and _is_fresh(parquet_fp, os.path.join(data_path, csv_name)):
+            continue
+        season = read_csv_season(os.path.join(data_path, csv_name))
+        season.to_parquet(parquet_fp, index=False)
+        written.append(parquet_fp)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert data/<year>_stats.csv files to the columnar season store.")
+    parser.add_argument('--data', default=os.path.join(os.getcwd(), 'data'), help="directory holding the season CSVs")
+    parser.add_argument('--force', action='store_true', help="rewrite seasons even if the store is up to date")
+    args = parser.parse_args()
+    for fp in convert(args.data, force=args.force):
+        print(f"wrote {fp}")
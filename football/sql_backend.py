@@ -0,0 +1,186 @@
+# sql_backend.py
+"""
+Optional embedded SQL backend (SQLite, standard library - no server, one local file).
+
+Builds football.sqlite next to main.py from data/, games/ and metadata/, one season at
+a time. Screens call the query helpers below to run the bets and matchup aggregations
+inside the engine and only pull the (small) results into pandas.
+
+This is an optional query path only: load_data still reads every season into pandas
+for the other screens, so enabling it saves no memory.
+
+Build or rebuild the database from the football/ directory with:
+    python sql_backend.py
+and enable it for the dashboard with:
+    FOOTBALL_BACKEND=sqlite streamlit run main.py
+"""
+import os
+import re
+import sqlite3
+import argparse
+import pandas as pd
+from schema import INT_STAT_COLUMNS, FLOAT_STAT_COLUMNS, GAME_INT_COLUMNS, STRING_COLUMNS, DERIVED_STAT_COLUMNS
+from season_store import season_files, STORE_DIR
+
+DB_FILENAME = 'football.sqlite'
+BACKEND_ENV = 'FOOTBALL_BACKEND'
+
+PLAYER_WEEK_COLUMNS = (
+    STRING_COLUMNS + INT_STAT_COLUMNS + FLOAT_STAT_COLUMNS + GAME_INT_COLUMNS + DERIVED_STAT_COLUMNS
+    + ['week_padded', 'year', 'year_week', 'Real_Team',
+       'Season_Passing_Yds', 'Season_Rushing_Yds', 'Season_Receiving_Yds']
+)
+# stat columns a caller may name in a query (column names cannot be bound parameters)
+QUERY_STATS = set(INT_STAT_COLUMNS + FLOAT_STAT_COLUMNS + DERIVED_STAT_COLUMNS)
+
+
+def enabled():
+    return os.environ.get(BACKEND_ENV, '').lower() == 'sqlite'
+
+
+def db_path(path=None):
+    return os.path.join(path or os.getcwd(), DB_FILENAME)
+
+
+def is_fresh(database, path=None):
+    """
+    True when the database is newer than every source file it was built from (the
+    CSVs under data/, games/ and metadata/). The columnar store in data/columnar/ is a
+    copy of the same CSVs, so rewriting it does not make the database stale.
+    """
+    if not os.path.exists(database):
+        return False
+    built = os.path.getmtime(database)
+    path = path or os.getcwd()
+    for folder in ['data', 'games', 'metadata']:
+        for root, dirs, names in os.walk(os.path.join(path, folder)):
+            dirs[:] = [d for d in dirs if d != STORE_DIR]
+            if any(os.path.getmtime(os.path.join(root, n)) > built for n in names):
+                return False
+    return True
+
+
+def connect(database):
+    """Read-only connection for the screens."""
+    return sqlite3.connect(f'file:{database}?mode=ro', uri=True, check_same_thread=False)
+
+
+def _stat(stat):
+    if stat not in QUERY_STATS:
+        raise ValueError(f"unknown stat column: {stat}")
+    return f'"{stat}"'
+
+
+def build_database(path=None, database=None):
+    """(Re)build the database file. Player weeks are written one season at a time."""
+    from data_loader import _read_player_files, _derive_seasons, _read_games
+
+    path = path or os.getcwd()
+    database = database or db_path(path)
+    data_path = os.path.join(path, 'data')
+    tmp = database + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    con = sqlite3.connect(tmp)
+    try:
+        for file in season_files(data_path):
+            season = _derive_seasons(_read_player_files(data_path, [file]))
+            season = season.reindex(columns=PLAYER_WEEK_COLUMNS)
+            season.to_sql('player_weeks', con, if_exists='append', index=False)
+
+        games_path = os.path.join(path, 'games')
+        seasons = sorted({m.group(1) for f in os.listdir(games_path)
+                          for m in [re.match(r'(?:upcoming|completed)_games_(\d{4})\.csv$', f)] if m})
+        for season in seasons:
+            upcoming, completed = _read_games(games_path, season)
+            if not completed.empty:
+                completed.to_sql('completed_games', con, if_exists='append', index=False)
+            if not upcoming.empty:
+                upcoming.to_sql('upcoming_games', con, if_exists='append', index=False)
+
+        for name in ['team_colors', 'team_location']:
+            fp = os.path.join(path, 'metadata', f'{name}.csv')
+            if os.path.exists(fp):
+                pd.read_csv(fp).to_sql(name, con, if_exists='replace', index=False)
+
+        con.executescript("""
+            CREATE INDEX IF NOT EXISTS ix_pw_player_year ON player_weeks (Player, year);
+            CREATE INDEX IF NOT EXISTS ix_pw_year ON player_weeks (year);
+            CREATE INDEX IF NOT EXISTS ix_pw_team_week ON player_weeks (Real_Team, year_week);
+        """)
+        con.commit()
+    finally:
+        con.close()
+    os.replace(tmp, database)
+    return database
+
+
+def bet_counts(con, stat, target, years, current_year):
+    """
+    bets.bet_df aggregation: per player over the selected years, games at or above
+    target and total games; only players whose latest selected season is current_year.
+    A game is one player-week (its largest value when a player has two rows in a
+    week), the same count as the pandas path (hit_rates.HitTable).
+    """
+    years = [str(y) for y in years]
+    if not years:
+        return pd.DataFrame(columns=['Player', 'Count_games', 'Total_games', '% of Games'])
+    marks = ','.join('?' * len(years))
+    query = f"""
+        WITH games AS (
+            SELECT Player, year_week, MAX(year) AS year, MAX({_stat(stat)}) AS value
+            FROM player_weeks
+            WHERE year IN ({marks})
+            GROUP BY Player, year_week
+        )
+        SELECT Player,
+               SUM(CASE WHEN value >= ? THEN 1 ELSE 0 END) AS Count_games,
+               COUNT(DISTINCT year_week) AS Total_games
+        FROM games
+        GROUP BY Player
+        HAVING Count_games > 0 AND MAX(year) = ?
+        ORDER BY Player
+    """
+    out = pd.read_sql_query(query, con, params=[*years, target, str(current_year)])
+    out['% of Games'] = round((out['Count_games'] / out['Total_games']) * 100, 1)
+    return out.sort_values(['Count_games', '% of Games'], ascending=False, kind='stable').reset_index(drop=True)
+
+
+def matchup_past(con, stat, away_team, home_team, season):
+    """
+    upcoming_games.combine_info join: each completed game of the season involving
+    either team (seen from the home team when they met), joined to the players of the
+    searched team ('Offense <team>') and of its opponent ('Defense <team>') who
+    recorded the stat.
+    """
+    stat_col = _stat(stat)
+    # only the yardage stats have a season total column; others get a bare NULL
+    season_col = f'p."Season_{stat}"' if stat in ['Passing_Yds', 'Rushing_Yds', 'Receiving_Yds'] else 'NULL'
+    query = f"""
+        WITH games AS (
+            SELECT year_week,
+                   CASE WHEN team1 = :home OR (team2 <> :home AND team1 = :away) THEN team1 ELSE team2 END AS searched_team,
+                   CASE WHEN team1 = :home OR (team2 <> :home AND team1 = :away) THEN team2 ELSE team1 END AS opponent_team
+            FROM completed_games
+            WHERE season = :season AND (team1 IN (:away, :home) OR team2 IN (:away, :home))
+        )
+        SELECT p.year_week, p.Player, p.Real_Team, g.searched_team, g.opponent_team,
+               'Offense ' || g.searched_team AS team_category,
+               p.{stat_col} AS {stat_col}, {season_col} AS "Season_{stat}"
+        FROM games g JOIN player_weeks p ON p.year_week = g.year_week AND p.Real_Team = g.searched_team
+        WHERE p.{stat_col} > 0
+        UNION ALL
+        SELECT p.year_week, p.Player, p.Real_Team, g.searched_team, g.opponent_team,
+               'Defense ' || g.searched_team, p.{stat_col}, {season_col}
+        FROM games g JOIN player_weeks p ON p.year_week = g.year_week AND p.Real_Team = g.opponent_team
+        WHERE p.{stat_col} > 0
+    """
+    params = {'away': away_team, 'home': home_team, 'season': int(season)}
+    return pd.read_sql_query(query, con, params=params)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the embedded SQLite database for the dashboard.")
+    parser.add_argument('--path', default=os.getcwd(), help="football/ directory holding data/, games/ and metadata/")
+    args = parser.parse_args()
+    print(f"wrote {build_database(args.path)}")
@@ -0,0 +1,49 @@
+# team_map.py
+"""
+Home page team map. Built once per snapshot (see utils.memoize) instead of on every
+rerun: markers use the logo service's pre-resized PNG thumbnails, and clicks are
+resolved with a marker position -> team dict.
+
+Each rerun hands st_folium a copy of the cached Map (see map_for_render). Passing
+HTML/JSON rendered once per snapshot was dropped: st_folium only accepts a folium
+object and always renders it itself, so that step (~150 ms) still runs per rerun.
+"""
+import os
+import base64
+import copy
+import folium
+import logos
+
+def _data_uri(fp):
+    with open(fp, 'rb') as f:
+        return 'data:image/png;base64,' + base64.b64encode(f.read()).decode('ascii')
+
+
+def build_team_map(location_df):
+    """(folium.Map with one logo marker per team, {(latitude, longitude): city_team})"""
+    m = folium.Map(location=[39.8283, -98.5795], zoom_start=4)
+    teams_by_position = {}
+    for loc in location_df.to_dict('records'):
+        try:
+            icon_url = logos.png_data_uri(os.path.dirname(loc["logo_path"]), loc['city_team'], 50) or _data_uri(loc["logo_path"])
+            icon = folium.CustomIcon(icon_url, icon_size=(50, 50))
+            folium.Marker(location=[loc["latitude"], loc["longitude"]], icon=icon, popup=loc['city_team']).add_to(m)
+        except Exception:
+            # fallback: plain marker
+            folium.Marker(location=[loc.get("latitude", 39.0), loc.get("longitude", -98.0)], popup=loc.get('city_team','')).add_to(m)
+        teams_by_position[(loc.get("latitude"), loc.get("longitude"))] = loc.get('city_team')
+    return m, teams_by_position
+
+
+def map_for_render(m):
+    """Private copy of the cached Map for st_folium; rendering appends scripts to the
+    Map it is given, so the shared one would grow (and remount) on every rerun."""
+    return copy.deepcopy(m)
+
+
+def clicked_team(map_data, teams_by_position):
+    """Team of the marker clicked last, or None."""
+    clicked = (map_data or {}).get("last_object_clicked")
+    if not clicked:
+        return None
+    return teams_by_position.get((clicked.get('lat'), clicked.get('lng')))
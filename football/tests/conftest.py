@@ -0,0 +1,47 @@
+# tests/conftest.py
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# the app imports its modules from football/ (streamlit run main.py from there)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schema import INT_STAT_COLUMNS, DERIVED_STAT_COLUMNS  # noqa: E402
+
+TEAMS = ['BUF', 'DET', 'KAN', 'PHI']
+
+
+def make_player_weeks(seed=0, players=12, seasons=('2022', '2023', '2024'), weeks=17):
+    """
+    Random rows shaped like data['df']: one row per player-week (a player misses about
+    a fifth of the weeks), categorical Player, string year and year_week, whole-number
+    counting stats, a passer rating with decimals and a longest reception that is
+    blank when there was no catch.
+    """
+    rng = np.random.default_rng(seed)
+    names = [f'Player {i:02d}' for i in range(players)]
+    rows = []
+    for season in seasons:
+        for p, name in enumerate(names):
+            for week in range(1, weeks + 1):
+                if rng.random() < 0.2:
+                    continue
+                rows.append((name, TEAMS[p % len(TEAMS)], season, week))
+    df = pd.DataFrame(rows, columns=['Player', 'Team', 'year', 'week'])
+    df['year_week'] = df['year'] + '_' + df['week'].map('{:02d}'.format)
+    for col in INT_STAT_COLUMNS + DERIVED_STAT_COLUMNS:
+        df[col] = rng.integers(0, 60, len(df))
+    df['Passing_Yds'] = rng.integers(-5, 400, len(df))
+    df['Rushing_Yds'] = rng.integers(-10, 150, len(df))
+    df['Receiving_Rec'] = rng.integers(0, 12, len(df))
+    df['Passing_Rate'] = np.round(rng.uniform(0, 158.3, len(df)), 1)
+    df['Receiving_Lng'] = np.where(df['Receiving_Rec'] > 0, rng.integers(0, 80, len(df)), np.nan)
+    df['Player'] = pd.Categorical(df['Player'], categories=sorted(names))
+    return df
+
+
+@pytest.fixture
+def player_weeks():
+    return make_player_weeks()
@@ -0,0 +1,88 @@
+# tests/test_hit_rates.py
+import numpy as np
+import pandas as pd
+import pytest
+from hit_rates import HitRates
+
+STATS = ['Passing_Yds', 'Rushing_Yds', 'Receiving_Rec', 'Receiving_Lng', 'Passing_Rate']
+
+
+def legacy_bet_counts(df, stat, target, years):
+    """The bets page's pandas counts before hit_rates: filter, group and count rows."""
+    selected = df.loc[df['year'].isin(years)]
+    hits = selected.loc[selected[stat] >= target].groupby('Player', observed=True)[['year_week']].count()
+    total = selected.groupby('Player', observed=True)['year_week'].count()
+    out = hits.rename({'year_week': 'Count_games'}, axis=1).reset_index()
+    out['Player'] = out['Player'].astype(str)
+    out['Total_games'] = out['Player'].map(total.rename(index=str))
+    return out.sort_values('Player').reset_index(drop=True)
+
+
+@pytest.mark.parametrize('stat', STATS)
+@pytest.mark.parametrize('years', [['2022', '2023', '2024'], ['2024'], ['2024', '2022']])
+def test_frame_matches_legacy_bet_counts(player_weeks, stat, years):
+    table = HitRates(player_weeks).table(stat, years)
+    for target in [-20, 0, 1, 5, 33.3, 50, 120, 399, 1000]:
+        frame = table.frame(target)
+        frame = frame.loc[frame['Count_games'] > 0].sort_values('Player').reset_index(drop=True)
+        expected = legacy_bet_counts(player_weeks, stat, target, years)
+        pd.testing.assert_frame_equal(frame[['Player', 'Count_games', 'Total_games']], expected, check_dtype=False)
+
+
+def test_duplicate_week_counts_once(player_weeks):
+    row = player_weeks.iloc[[0]].copy()
+    row['Passing_Yds'] = player_weeks['Passing_Yds'].iloc[0] + 500
+    df = pd.concat([player_weeks, row], ignore_index=True)
+    player = str(row['Player'].iloc[0])
+    table = HitRates(df).table('Passing_Yds')
+    games = df.loc[df['Player'] == player, 'year_week'].nunique()
+    assert table.frame(0).set_index('Player').loc[player, 'Total_games'] == games
+    # the week's largest row is its value
+    assert table.hits(player, 500) == 1
+
+
+def test_tables_are_cached_per_stat_and_years(player_weeks):
+    rates = HitRates(player_weeks)
+    assert rates.table('Passing_Yds', ['2024', '2023']) is rates.table('Passing_Yds', ['2023', '2024'])
+    assert rates.table('Passing_Yds') is not rates.table('Passing_Yds', ['2024'])
+    assert rates.table('Passing_Yds', []).frame(0).empty
+
+
+def brute_force_hits(df, stat, target, years=None):
+    """{player: games with a value >= target}, one value per player-week (its largest)."""
+    rows = df if years is None else df.loc[df['year'].isin(years)]
+    per_game = rows.groupby(['Player', 'year_week'], observed=True)[stat].max()
+    return (per_game >= target).groupby(level='Player', observed=True).sum().rename(index=str).to_dict()
+
+
+@pytest.mark.parametrize('stat', STATS)
+@pytest.mark.parametrize('years', [None, ['2023', '2024']])
+def test_ladder_and_search_match_brute_force(player_weeks, stat, years):
+    table = HitRates(player_weeks).table(stat, years)
+    width = table.ladder.shape[1]
+    # every integer line on the ladder, half-point lines (binary search), lines below
+    # zero and beyond the ladder's width
+    targets = list(range(width)) + [k + 0.5 for k in range(0, width, 7)] + [-10, -0.5, width, width + 0.5, 10 * width]
+    for target in targets:
+        expected = brute_force_hits(player_weeks, stat, target, years)
+        assert dict(zip(table.players, table.hits_all(target).tolist())) == expected, target
+        for player in table.players[:4]:
+            assert table.hits(player, target) == expected[player], (player, target)
+
+
+def test_ladder_layout(player_weeks):
+    table = HitRates(player_weeks).table('Receiving_Lng')
+    finite = table.values[np.isfinite(table.values)]
+    assert table.ladder.shape == (len(table.players), int(finite.max()) + 1)
+    # at line 0 every game with a value counts; games with a blank value never do
+    assert (table.ladder[:, 0] == table.hits_all(-0.5)).all()
+    assert (table.ladder[:, 0] <= table.games).all()
+    # non-increasing along the lines
+    assert (np.diff(table.ladder.astype(int), axis=1) <= 0).all()
+    assert not table.ladder.flags.writeable
+
+
+def test_unknown_player(player_weeks):
+    table = HitRates(player_weeks).table('Passing_Yds')
+    assert table.hits('Nobody', 0) == 0
+    assert table.hits('Nobody', 2.5) == 0
@@ -0,0 +1,47 @@
+# tests/test_leaderboards.py
+import numpy as np
+import pandas as pd
+from leaderboards import SeasonBoard
+from conftest import make_player_weeks
+
+
+def season_rows(weeks, seed=0):
+    # 2024 only, with players who first appear in later weeks
+    df = make_player_weeks(seed=seed, players=16, seasons=('2024',))
+    late = df['Player'].isin(['Player 14', 'Player 15']) & (df['week'] <= 10)
+    df = df.loc[~late]
+    return df.loc[df['week'].isin(weeks)].reset_index(drop=True)
+
+
+def assert_same_board(board, expected):
+    pd.testing.assert_frame_equal(board.table, expected.table, check_dtype=False)
+    assert board.order.keys() == expected.order.keys()
+    for stat in expected.order:
+        assert np.array_equal(board.order[stat], expected.order[stat]), stat
+
+
+def test_updated_with_new_weeks_equals_build():
+    board = SeasonBoard.build('2024', season_rows(range(1, 11)))
+    for last_week in [11, 14, 17]:
+        rows = season_rows(range(1, last_week + 1))
+        board = board.updated(rows)
+        assert_same_board(board, SeasonBoard.build('2024', rows))
+
+
+def test_updated_without_changes_reuses_board():
+    rows = season_rows(range(1, 11))
+    board = SeasonBoard.build('2024', rows)
+    assert board.updated(rows) is board
+
+
+def test_updated_after_an_edited_week_equals_build():
+    board = SeasonBoard.build('2024', season_rows(range(1, 11)))
+    rows = season_rows(range(1, 13))
+    rows.loc[rows['week'] == 3, 'Passing_Yds'] += 7
+    assert_same_board(board.updated(rows), SeasonBoard.build('2024', rows))
+
+
+def test_updated_after_a_removed_week_equals_build():
+    board = SeasonBoard.build('2024', season_rows(range(1, 11)))
+    rows = season_rows([w for w in range(1, 13) if w != 5])
+    assert_same_board(board.updated(rows), SeasonBoard.build('2024', rows))
@@ -1,5 +1,7 @@
 # utils.py
+import threading
 import altair as alt
+import numpy as np
 import pandas as pd
 
 # Small mapping used in original
@@ -51,13 +53,102 @@ def target_lines(input_value, perc_of_games):
     )
     return target_line, target_label
 
-def highlight_team(df_row, team_selected):
+def highlight_team_rows(df, team_selected, column='NFL_Team'):
     """
-    Return a list of style strings for pandas styler (used before .style.apply)
-    Keep simple: highlight row if NFL_Team equals team_selected
+    Style frame for Styler.apply(..., axis=None): rows whose NFL_Team is team_selected
+    get a yellow background. One call for the whole table instead of one per row.
     """
-    try:
-        color = 'background-color: yellow' if df_row.get('NFL_Team', '') == team_selected else ''
-        return [color] * len(df_row)
-    except Exception:
-        return [''] * len(df_row)
+    on_team = (df[column] == team_selected).to_numpy() if column in df.columns else np.zeros(len(df), dtype=bool)
+    rows = np.where(on_team, 'background-color: yellow', '')
+    return pd.DataFrame(np.repeat(rows[:, None], df.shape[1], axis=1), index=df.index, columns=df.columns)
+
+def percent_gradient(values):
+    """
+    Styles for a column of percentages, for Styler.apply(..., subset=[col]): red below
+    25, red to yellow from 25 to 50, yellow to green from 50 to 100. Computed on the
+    whole column at once.
+    """
+    v = np.asarray(values, dtype=float)
+    with np.errstate(invalid='ignore'):
+        red = np.where(v >= 50, 255 * (1 - (v - 50) / 50), 255)
+        green = np.where(v >= 50, 255, np.where(v >= 25, 255 * ((v - 25) / 25), 0))
+    red = np.nan_to_num(red).astype(int).astype(str)
+    green = np.nan_to_num(green).astype(int).astype(str)
+    styles = np.char.add(np.char.add(np.char.add(np.char.add('background-color: rgba(', red), ', '), green), ', 0, 1); color: black;')
+    return pd.Series(styles, index=getattr(values, 'index', None))
+
+def take_rows(data, index_name, keys, columns=None):
+    """
+    Rows of data['df'] for a list of keys of one of the load_data indexes
+    ('team_year', 'player_year'), in frame order. With columns, only those columns
+    are taken (see project), so the full-width rows are never materialized.
+    """
+    df = data['df'] if columns is None else project(data, columns)
+    index = data['indexes'][index_name]
+    positions = [index[k] for k in keys if k in index]
+    if not positions:
+        return df.iloc[0:0]
+    return df.take(np.sort(np.concatenate(positions)))
+
+def project(data, columns):
+    """
+    The given columns of data['df'] as a narrow frame. Screens declare the columns they
+    read; the result shares the snapshot's (read-only) arrays, so nothing is copied.
+    """
+    df = data['df']
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise KeyError(f"columns not in the player-week frame: {missing}")
+    return pd.DataFrame({c: df[c] for c in columns}, copy=False)
+
+def freeze(df):
+    """
+    The same frame rebuilt on read-only column arrays: writing values in place
+    (df.loc[...] = ..., df[col] += ...) raises ValueError. Only the array values are
+    protected; the frame object itself is not, so adding or dropping a column or an
+    inplace=True call on a shared frame would still change it for every session.
+    Screens work on a shallow copy (df.copy(deep=False)) or a project() view instead.
+    """
+    columns = {}
+    for col, series in df.items():
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy().copy()
+            codes.flags.writeable = False
+            columns[col] = pd.Categorical.from_codes(codes, dtype=series.dtype)
+        elif isinstance(series.dtype, np.dtype):
+            values = series.to_numpy().copy()
+            values.flags.writeable = False
+            columns[col] = values
+        else:
+            columns[col] = series.array
+    # copy=False keeps one block per column, so the read-only arrays are used as they are
+    return pd.DataFrame(columns, index=df.index, columns=df.columns, copy=False)
+
+_MEMO_LOCK = threading.Lock()
+
+def memoize(data, key, build):
+    """
+    build() once per snapshot and key, shared by every session. The cache lives on the
+    snapshot (data['memo']), so it is dropped together with it when the data changes.
+    """
+    memo = data['memo']
+    with _MEMO_LOCK:
+        if key in memo:
+            return memo[key]
+    value = build()
+    with _MEMO_LOCK:
+        return memo.setdefault(key, value)
+
+def expand_frames(df, frame_col='week', out_col='current_week'):
+    """
+    Animation frames for cumulative charts: for every distinct value w of frame_col (in
+    ascending order) the rows with frame_col <= w, tagged with out_col = w. Same rows
+    and order as looping over the values and concatenating the filtered copies, built
+    with one boolean frame-by-row mask and a single take.
+    """
+    values = df[frame_col].to_numpy()
+    frames = np.unique(values)
+    frame_pos, row_pos = np.nonzero(values[None, :] <= frames[:, None])
+    expanded = df.take(row_pos).reset_index(drop=True)
+    expanded[out_col] = frames[frame_pos]
+    return expanded